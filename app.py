@@ -4,32 +4,254 @@ Omex Coin Sniper Microservice API
 A well-documented API for coin sniping operations on Solana blockchain
 """
 
-from flask import Flask, request, jsonify
+import os
+import sys
+
+# When running under gunicorn's gevent worker, sockets/ssl used by the
+# services must be patched before anything else is imported so the sparse
+# websocket/RPC waits yield cooperatively instead of blocking the worker
+if os.getenv('GUNICORN_WORKER_CLASS', '').lower() == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+elif sys.platform != 'win32':
+    # Asyncio loops created by the service threads (HeliusAPI, monitors)
+    # get libuv's fast path; skipped under gevent, whose patched sockets
+    # do not mix with uvloop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+from flask import Flask, request, jsonify, make_response, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_restx import Api, Resource, fields, Namespace
+import flask_restx.representations
+import functools
 import logging
-import os
+import orjson
+from pydantic import BaseModel as PydanticBaseModel
+import queue
+import re
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Optional
 
-# Import our services
-from services.sniper_service import SniperService
-from services.monitoring_service import MonitoringService
-from services.trading_service import TradingService
-from services.config_service import ConfigService
-from services.database_service import db_service
+# auth_service is needed at import time for the route decorators; the other
+# services are deferred behind cached getters (see below) so workers that
+# never touch them don't pay the solana/sqlalchemy import cost
 from services.auth_service import auth_service, require_auth, require_admin, get_current_user
 from models.schemas import (
-    TokenInfo, Position, TradeRequest, TradeResponse, 
+    TokenInfo, Position, TradeRequest, TradeResponse,
     SniperConfig, HealthStatus, ErrorResponse
 )
 
-# Configure logging
+
+@functools.cache
+def _sniper():
+    from services.sniper_service import SniperService
+    return SniperService()
+
+
+@functools.cache
+def _monitoring():
+    from services.monitoring_service import MonitoringService
+    return MonitoringService()
+
+
+@functools.cache
+def _trading():
+    from services.trading_service import TradingService
+    return TradingService()
+
+
+@functools.cache
+def _config():
+    from services.config_service import ConfigService
+    return ConfigService()
+
+
+@functools.cache
+def _db():
+    from services.database_service import db_service
+    return db_service
+
+# Configure logging. Request threads only enqueue records; a background
+# listener thread does the formatting and stream I/O, so the logging lock
+# never serializes concurrent request handling under threaded workers.
 logging.basicConfig(level=logging.INFO)
+_log_queue = queue.SimpleQueue()
+_log_handlers = tuple(logging.root.handlers)
+logging.root.handlers = [QueueHandler(_log_queue)]
+_log_listener = None
+_log_listener_pid = None
+
+
+def start_log_listener():
+    """Start (or restart) the queue-draining listener in this process.
+
+    With gunicorn's preload_app the import-time start only runs in the
+    master; forked workers inherit the root QueueHandler but not the
+    listener thread, so gunicorn's post_fork hook calls this again to
+    give each worker its own drain thread.
+    """
+    global _log_listener, _log_listener_pid
+    if _log_listener is not None and _log_listener_pid == os.getpid():
+        return
+    _log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+    _log_listener.start()
+    _log_listener_pid = os.getpid()
+
+
+start_log_listener()
 logger = logging.getLogger(__name__)
 
+def _orjson_default(obj):
+    """Fallback for types orjson doesn't know natively.
+
+    Pydantic response models (UserResponse, WalletResponse, ...) are dumped
+    here exactly once, straight into the orjson pass — no per-route
+    dict() round-trip or re-validation on the way out.
+    """
+    if isinstance(obj, PydanticBaseModel):
+        return obj.model_dump(mode='json', exclude_none=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster response serialization"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC, default=_orjson_default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def _orjson_output(data, code, headers=None):
+    """flask-restx JSON representation using orjson"""
+    response = make_response(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC, default=_orjson_default), code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
+
+
+def _cached(ttl=5.0):
+    """Cache a read-only GET response in-process for a few seconds
+
+    Collapses bursts of identical status/balance requests into a single
+    upstream RPC call. If the upstream call fails, the last good response
+    is served instead of a 500 so a momentary outage stays invisible.
+    """
+    def _is_error(value):
+        # Handlers report failures as ({'error': ...}, status) tuples
+        # rather than raising, so inspect the status code
+        return (
+            isinstance(value, tuple)
+            and len(value) > 1
+            and isinstance(value[1], int)
+            and value[1] >= 400
+        )
+
+    def decorator(func):
+        lock = threading.Lock()
+        state = {'expires': 0.0, 'value': None}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with lock:
+                if state['value'] is not None and time.monotonic() < state['expires']:
+                    return state['value']
+            try:
+                value = func(*args, **kwargs)
+            except Exception:
+                with lock:
+                    if state['value'] is not None:
+                        return state['value']
+                raise
+            if _is_error(value):
+                # Never pin an error for the TTL; prefer the last good value
+                with lock:
+                    if state['value'] is not None:
+                        return state['value']
+                return value
+            with lock:
+                state['value'] = value
+                state['expires'] = time.monotonic() + ttl
+            return value
+        return wrapper
+    return decorator
+
+
+# Front-door format checks: reject malformed keys/mints in nanoseconds
+# instead of letting them fail deep in the Solana RPC path seconds later
+_B58_PRIVKEY_RE = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{43,88}$')
+_B58_MINT_RE = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$')
+
+
+def _valid_private_key(private_key):
+    """Cheap format check for a private key (base58 or JSON byte array)"""
+    return bool(_B58_PRIVKEY_RE.match(private_key)) or private_key.startswith('[')
+
+
+def _json_body():
+    """Parse the request body with orjson (raises ValueError on bad JSON)"""
+    return orjson.loads(request.get_data(cache=False) or b'{}')
+
+
+def _orjson_list_response(rows):
+    """Serialize a list endpoint in one orjson pass, skipping flask-restx marshaling
+
+    flask-restx walks every model field per row in interpreted Python;
+    orjson emits the whole list (dataclasses and datetimes included) in
+    a single C pass, which matters for large positions/token lists.
+    """
+    return Response(orjson.dumps(rows, option=orjson.OPT_NAIVE_UTC), mimetype='application/json')
+
+
+def _orjson_stream_response(rows):
+    """Stream a JSON array one row at a time
+
+    Unlike _orjson_list_response this never materializes the whole payload,
+    so peak memory stays O(1) per row when the monitored-token or position
+    lists grow large.
+    """
+    def _gen():
+        yield b'['
+        first = True
+        for row in rows:
+            if first:
+                first = False
+            else:
+                yield b','
+            yield orjson.dumps(row, option=orjson.OPT_NAIVE_UTC)
+        yield b']'
+    return Response(stream_with_context(_gen()), mimetype='application/json')
+
+
+def compile_marshaller(model):
+    """Generate a specialized serializer for a fixed flask-restx model
+
+    flask-restx's generic marshaller walks the field dict and runs
+    isinstance checks per field per row. The model schemas here are frozen
+    at import time, so we exec a straight-line function that reads each
+    field explicitly — same output, no interpretive dispatch per field.
+    """
+    parts = ', '.join(f"{name!r}: getattr(o, {name!r}, None)" for name in model)
+    namespace = {}
+    exec(f"def _marshal(o):\n    return {{{parts}}}", namespace)
+    return namespace['_marshal']
+
+
+# Route marshal_with responses through orjson as well
+flask_restx.representations.output_json = _orjson_output
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Initialize API with Swagger documentation
@@ -41,6 +263,7 @@ api = Api(
     doc='/docs/',
     prefix='/api/v1'
 )
+api.representations['application/json'] = _orjson_output
 
 # Create namespaces for different API sections
 sniper_ns = Namespace('sniper', description='Sniper operations')
@@ -62,12 +285,6 @@ api.add_namespace(auth_ns, path='/auth')
 api.add_namespace(user_ns, path='/user')
 api.add_namespace(wallet_ns, path='/wallet')
 
-# Initialize services
-sniper_service = SniperService()
-monitoring_service = MonitoringService()
-trading_service = TradingService()
-config_service = ConfigService()
-
 # Define API models for documentation
 token_info_model = api.model('TokenInfo', {
     'mint': fields.String(required=True, description='Token mint address'),
@@ -140,17 +357,22 @@ error_response_model = api.model('ErrorResponse', {
     'details': fields.String(description='Error details')
 })
 
+# Pre-compiled serializers for the hot list endpoints
+_marshal_token_info = compile_marshaller(token_info_model)
+_marshal_position = compile_marshaller(position_model)
+
 # Health Check Endpoints
 @health_ns.route('/status')
 class HealthStatus(Resource):
+    @_cached(ttl=5.0)
     @api.marshal_with(health_status_model)
     def get(self):
         """Get service health status"""
         try:
-            status = sniper_service.get_health_status()
+            status = _sniper().get_health_status()
             return status, 200
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return {'error': str(e)}, 500
 
 @health_ns.route('/ping')
@@ -166,10 +388,10 @@ class SniperConfigResource(Resource):
     def get(self):
         """Get current sniper configuration"""
         try:
-            config = config_service.get_sniper_config()
+            config = _config().get_sniper_config()
             return config, 200
         except Exception as e:
-            logger.error(f"Failed to get sniper config: {e}")
+            logger.error("Failed to get sniper config: %s", e)
             return {'error': str(e)}, 500
 
     @api.expect(sniper_config_model)
@@ -177,24 +399,24 @@ class SniperConfigResource(Resource):
     def put(self):
         """Update sniper configuration"""
         try:
-            config_data = request.get_json()
-            updated_config = config_service.update_sniper_config(config_data)
+            config_data = _json_body()
+            updated_config = _config().update_sniper_config(config_data)
             return updated_config, 200
         except Exception as e:
-            logger.error(f"Failed to update sniper config: {e}")
+            logger.error("Failed to update sniper config: %s", e)
             return {'error': str(e)}, 500
 
 # Monitoring Endpoints
 @monitoring_ns.route('/tokens')
 class TokenMonitoring(Resource):
-    @api.marshal_list_with(token_info_model)
+    @api.response(200, 'Success', [token_info_model])
     def get(self):
         """Get currently monitored tokens"""
         try:
-            tokens = monitoring_service.get_monitored_tokens()
-            return tokens, 200
+            tokens = _monitoring().get_monitored_tokens()
+            return _orjson_stream_response(_marshal_token_info(t) for t in tokens)
         except Exception as e:
-            logger.error(f"Failed to get monitored tokens: {e}")
+            logger.error("Failed to get monitored tokens: %s", e)
             return {'error': str(e)}, 500
 
 @monitoring_ns.route('/start')
@@ -202,10 +424,10 @@ class StartMonitoring(Resource):
     def post(self):
         """Start token monitoring"""
         try:
-            result = monitoring_service.start_monitoring()
+            result = _monitoring().start_monitoring()
             return {'success': result, 'message': 'Monitoring started' if result else 'Failed to start monitoring'}, 200
         except Exception as e:
-            logger.error(f"Failed to start monitoring: {e}")
+            logger.error("Failed to start monitoring: %s", e)
             return {'error': str(e)}, 500
 
 @monitoring_ns.route('/stop')
@@ -213,23 +435,23 @@ class StopMonitoring(Resource):
     def post(self):
         """Stop token monitoring"""
         try:
-            result = monitoring_service.stop_monitoring()
+            result = _monitoring().stop_monitoring()
             return {'success': result, 'message': 'Monitoring stopped' if result else 'Failed to stop monitoring'}, 200
         except Exception as e:
-            logger.error(f"Failed to stop monitoring: {e}")
+            logger.error("Failed to stop monitoring: %s", e)
             return {'error': str(e)}, 500
 
 # Trading Endpoints
 @trading_ns.route('/positions')
 class Positions(Resource):
-    @api.marshal_list_with(position_model)
+    @api.response(200, 'Success', [position_model])
     def get(self):
         """Get current trading positions"""
         try:
-            positions = trading_service.get_positions()
-            return positions, 200
+            positions = _trading().iter_positions()
+            return _orjson_stream_response(_marshal_position(p) for p in positions)
         except Exception as e:
-            logger.error(f"Failed to get positions: {e}")
+            logger.error("Failed to get positions: %s", e)
             return {'error': str(e)}, 500
 
 @trading_ns.route('/trade')
@@ -239,11 +461,11 @@ class Trade(Resource):
     def post(self):
         """Execute a trade (buy/sell)"""
         try:
-            trade_data = request.get_json()
-            result = trading_service.execute_trade(trade_data)
+            trade_data = _json_body()
+            result = _trading().execute_trade(trade_data)
             return result, 200
         except Exception as e:
-            logger.error(f"Trade execution failed: {e}")
+            logger.error("Trade execution failed: %s", e)
             return {'error': str(e)}, 500
 
 @trading_ns.route('/positions/<string:mint>')
@@ -251,7 +473,9 @@ class PositionManagement(Resource):
     def delete(self, mint):
         """Close a specific position"""
         try:
-            result = trading_service.close_position(mint)
+            if not _B58_MINT_RE.match(mint):
+                return {'error': 'Invalid mint address format'}, 400
+            result = _trading().close_position(mint)
             return {'success': result, 'message': 'Position closed' if result else 'Failed to close position'}, 200
         except Exception as e:
             logger.error(f"Failed to close position {mint}: {e}")
@@ -263,10 +487,10 @@ class StartSniper(Resource):
     def post(self):
         """Start the sniper bot"""
         try:
-            result = sniper_service.start_sniper()
+            result = _sniper().start_sniper()
             return {'success': result, 'message': 'Sniper started' if result else 'Failed to start sniper'}, 200
         except Exception as e:
-            logger.error(f"Failed to start sniper: {e}")
+            logger.error("Failed to start sniper: %s", e)
             return {'error': str(e)}, 500
 
 @sniper_ns.route('/stop')
@@ -274,21 +498,22 @@ class StopSniper(Resource):
     def post(self):
         """Stop the sniper bot"""
         try:
-            result = sniper_service.stop_sniper()
+            result = _sniper().stop_sniper()
             return {'success': result, 'message': 'Sniper stopped' if result else 'Failed to stop sniper'}, 200
         except Exception as e:
-            logger.error(f"Failed to stop sniper: {e}")
+            logger.error("Failed to stop sniper: %s", e)
             return {'error': str(e)}, 500
 
 @sniper_ns.route('/status')
 class SniperStatus(Resource):
+    @_cached(ttl=2.0)
     def get(self):
         """Get sniper status"""
         try:
-            status = sniper_service.get_status()
+            status = _sniper().get_status()
             return status, 200
         except Exception as e:
-            logger.error(f"Failed to get sniper status: {e}")
+            logger.error("Failed to get sniper status: %s", e)
             return {'error': str(e)}, 500
 
 # Wallet Management
@@ -297,15 +522,17 @@ class ConnectWallet(Resource):
     def post(self):
         """Connect wallet with private key"""
         try:
-            data = request.get_json()
+            data = _json_body()
             private_key = data.get('private_key')
             if not private_key:
                 return {'error': 'Private key is required'}, 400
-            
-            result = config_service.connect_wallet(private_key)
+            if not _valid_private_key(private_key):
+                return {'error': 'Invalid private key format'}, 400
+
+            result = _config().connect_wallet(private_key)
             return {'success': result, 'message': 'Wallet connected' if result else 'Failed to connect wallet'}, 200
         except Exception as e:
-            logger.error(f"Failed to connect wallet: {e}")
+            logger.error("Failed to connect wallet: %s", e)
             return {'error': str(e)}, 500
 
 @config_ns.route('/wallet/disconnect')
@@ -313,21 +540,22 @@ class DisconnectWallet(Resource):
     def post(self):
         """Disconnect wallet"""
         try:
-            result = config_service.disconnect_wallet()
+            result = _config().disconnect_wallet()
             return {'success': result, 'message': 'Wallet disconnected' if result else 'Failed to disconnect wallet'}, 200
         except Exception as e:
-            logger.error(f"Failed to disconnect wallet: {e}")
+            logger.error("Failed to disconnect wallet: %s", e)
             return {'error': str(e)}, 500
 
 @config_ns.route('/wallet/balance')
 class WalletBalance(Resource):
+    @_cached(ttl=5.0)
     def get(self):
         """Get wallet SOL balance"""
         try:
-            balance = config_service.get_wallet_balance()
+            balance = _config().get_wallet_balance()
             return {'balance': balance}, 200
         except Exception as e:
-            logger.error(f"Failed to get wallet balance: {e}")
+            logger.error("Failed to get wallet balance: %s", e)
             return {'error': str(e)}, 500
 
 # Authentication Endpoints
@@ -336,7 +564,7 @@ class Register(Resource):
     def post(self):
         """Register new user"""
         try:
-            data = request.get_json()
+            data = _json_body()
             username = data.get('username')
             email = data.get('email')
             password = data.get('password')
@@ -348,7 +576,7 @@ class Register(Resource):
             return result, 201 if result['success'] else 400
             
         except Exception as e:
-            logger.error(f"Registration error: {e}")
+            logger.error("Registration error: %s", e)
             return {'error': str(e)}, 500
 
 @auth_ns.route('/login')
@@ -356,7 +584,7 @@ class Login(Resource):
     def post(self):
         """Login user"""
         try:
-            data = request.get_json()
+            data = _json_body()
             username = data.get('username')
             password = data.get('password')
             
@@ -367,7 +595,7 @@ class Login(Resource):
             return result, 200 if result['success'] else 401
             
         except Exception as e:
-            logger.error(f"Login error: {e}")
+            logger.error("Login error: %s", e)
             return {'error': str(e)}, 500
 
 @auth_ns.route('/logout')
@@ -386,7 +614,7 @@ class Logout(Resource):
             return result, 200 if result['success'] else 400
             
         except Exception as e:
-            logger.error(f"Logout error: {e}")
+            logger.error("Logout error: %s", e)
             return {'error': str(e)}, 500
 
 # User Management Endpoints
@@ -401,7 +629,7 @@ class UserProfile(Resource):
             return result, 200 if result['success'] else 404
             
         except Exception as e:
-            logger.error(f"Profile error: {e}")
+            logger.error("Profile error: %s", e)
             return {'error': str(e)}, 500
 
 # Wallet Management Endpoints
@@ -412,11 +640,11 @@ class WalletList(Resource):
         """Get user wallets"""
         try:
             user = g.current_user
-            wallets = db_service.get_user_wallets(user.id)
+            wallets = _db().get_user_wallets(user.id)
             return {'wallets': wallets}, 200
             
         except Exception as e:
-            logger.error(f"Get wallets error: {e}")
+            logger.error("Get wallets error: %s", e)
             return {'error': str(e)}, 500
 
 @wallet_ns.route('/')
@@ -426,21 +654,23 @@ class CreateWallet(Resource):
         """Create new wallet"""
         try:
             user = g.current_user
-            data = request.get_json()
+            data = _json_body()
             
             wallet_name = data.get('wallet_name')
             private_key = data.get('private_key')
             
             if not all([wallet_name, private_key]):
                 return {'error': 'Wallet name and private key are required'}, 400
-            
+            if not _valid_private_key(private_key):
+                return {'error': 'Invalid private key format'}, 400
+
             from models.user import WalletCreate
             wallet_data = WalletCreate(
                 wallet_name=wallet_name,
                 private_key=private_key
             )
             
-            wallet = db_service.create_wallet(user.id, wallet_data)
+            wallet = _db().create_wallet(user.id, wallet_data)
             
             if wallet:
                 return {'success': True, 'wallet': wallet}, 201
@@ -448,7 +678,7 @@ class CreateWallet(Resource):
                 return {'error': 'Failed to create wallet'}, 400
                 
         except Exception as e:
-            logger.error(f"Create wallet error: {e}")
+            logger.error("Create wallet error: %s", e)
             return {'error': str(e)}, 500
 
 @wallet_ns.route('/<int:wallet_id>/connect')
@@ -458,13 +688,13 @@ class ConnectWallet(Resource):
         """Connect to specific wallet"""
         try:
             user = g.current_user
-            private_key = db_service.get_wallet_private_key(user.id, wallet_id)
+            private_key = _db().get_wallet_private_key(user.id, wallet_id)
             
             if not private_key:
                 return {'error': 'Wallet not found or access denied'}, 404
             
             # Use existing config service to connect wallet
-            success = config_service.connect_wallet(private_key)
+            success = _config().connect_wallet(private_key)
             
             if success:
                 return {'success': True, 'message': 'Wallet connected'}, 200
@@ -472,7 +702,7 @@ class ConnectWallet(Resource):
                 return {'error': 'Failed to connect wallet'}, 400
                 
         except Exception as e:
-            logger.error(f"Connect wallet error: {e}")
+            logger.error("Connect wallet error: %s", e)
             return {'error': str(e)}, 500
 
 # Error handlers
@@ -488,6 +718,8 @@ if __name__ == '__main__':
     # Get configuration from environment
     port = int(os.getenv('PORT', 8000))
     debug = os.getenv('DEBUG', 'False').lower() == 'true'
-    
+
+    # The dev server is single-threaded; production runs under gunicorn
+    # (see gunicorn_conf.py and the Dockerfile CMD)
     logger.info(f"Starting Omex Coin Sniper API on port {port}")
     app.run(host='0.0.0.0', port=port, debug=debug)
@@ -1,7 +1,12 @@
+import atexit
 import os
-import json
 import logging
-from dataclasses import dataclass, asdict
+import threading
+import time
+
+import msgpack
+import orjson
+from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
 from dotenv import load_dotenv
@@ -38,7 +43,7 @@ PRIORITY_FEE = 0.0001  # SOL
 DEFAULT_SLIPPAGE = 1.0  # 1%
 DEFAULT_POOL = "pump"
 
-@dataclass
+@dataclass(slots=True)
 class BotSettings:
     """Bot trading settings"""
     sol_per_snipe: float = 0.01
@@ -71,7 +76,7 @@ class BotSettings:
     # Display settings
     max_tokens_in_table: int = 1000  # Maximum number of tokens to display in the frontend table
 
-@dataclass
+@dataclass(slots=True)
 class BotState:
     """Current bot state"""
     is_running: bool = False
@@ -81,7 +86,7 @@ class BotState:
     total_pnl: float = 0.0
     active_positions: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Complete application configuration"""
     private_key: str = ""
@@ -97,18 +102,34 @@ class AppConfig:
 class ConfigManager:
     """Manages application configuration with file persistence"""
     
+    # How long to coalesce bursts of updates before flushing to disk
+    FLUSH_DELAY = 0.5
+
     def __init__(self, config_file: str = "bot_config.json"):
-        self.config_file = Path(config_file)
+        # Binary msgpack file is the hot-path store; the old JSON file is
+        # only read once for migration (and kept for manual inspection)
+        self.legacy_json_file = Path(config_file)
+        self.config_file = self.legacy_json_file.with_suffix('.mpk')
         self.config = AppConfig()
+        self._dirty = threading.Event()
         self.load_config()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        atexit.register(self._flush_if_dirty)
     
     def load_config(self) -> None:
         """Load configuration from file"""
         try:
+            data = None
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                
+                data = msgpack.unpackb(self.config_file.read_bytes(), raw=False)
+            elif self.legacy_json_file.exists():
+                # Migrate a pre-msgpack JSON config once
+                logger.info("📦 Migrating legacy JSON config to msgpack")
+                data = orjson.loads(self.legacy_json_file.read_bytes())
+                self.save_config()
+
+            if data is not None:
                 # Load bot settings
                 if 'bot_settings' in data:
                     self.config.bot_settings = BotSettings(**data['bot_settings'])
@@ -138,36 +159,79 @@ class ConfigManager:
             logger.info("🔄 Using default configuration")
     
     def save_config(self) -> None:
-        """Save configuration to file"""
+        """Mark the configuration dirty; the background flusher writes it out
+
+        State updates arrive on every price tick, so writing synchronously
+        here would hit the disk hundreds of times per second. Instead the
+        in-memory config is authoritative and flushed at most once per
+        FLUSH_DELAY (and on process exit via atexit).
+        """
+        self._dirty.set()
+
+    def _flush_loop(self) -> None:
+        """Background flusher: coalesce bursts of updates into one write"""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.FLUSH_DELAY)
+            self._dirty.clear()
+            self._do_save()
+
+    def _flush_if_dirty(self) -> None:
+        """Flush any pending changes (registered as an atexit hook)"""
+        if self._dirty.is_set():
+            self._dirty.clear()
+            self._do_save()
+
+    @staticmethod
+    def _dataclass_to_dict(obj):
+        """msgpack default hook for the (slotted) config dataclasses"""
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
+    def _do_save(self) -> None:
+        """Write configuration to file"""
         try:
-            # Prepare data for saving
+            # Prepare data for saving; the msgpack default hook flattens the
+            # (slotted) dataclasses, so no intermediate dict copy is needed
             config_data = {
                 'private_key': self.config.private_key,
-                'bot_settings': asdict(self.config.bot_settings),
-                'bot_state': asdict(self.config.bot_state)
+                'bot_settings': self.config.bot_settings,
+                'bot_state': self.config.bot_state
             }
             
-            # Write to file with proper formatting
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            # Atomic write: dump to a temp file then os.replace so a crash
+            # mid-write never leaves a truncated config behind
+            tmp_file = self.config_file.with_suffix('.tmp')
+            tmp_file.write_bytes(
+                msgpack.packb(config_data, use_bin_type=True, default=self._dataclass_to_dict)
+            )
+            os.replace(tmp_file, self.config_file)
             
             logger.info("💾 Configuration saved successfully")
             
         except Exception as e:
             logger.error(f"❌ Error saving config: {e}")
     
+    # Field-name sets computed once so the per-tick update loops below do a
+    # set lookup instead of a hasattr() call per field
+    _SETTINGS_FIELDS = frozenset(BotSettings.__dataclass_fields__)
+    _STATE_FIELDS = frozenset(BotState.__dataclass_fields__)
+
     def update_bot_settings(self, **kwargs) -> None:
         """Update bot settings"""
+        settings = self.config.bot_settings
+        fields = self._SETTINGS_FIELDS
         for key, value in kwargs.items():
-            if hasattr(self.config.bot_settings, key):
-                setattr(self.config.bot_settings, key, value)
+            if key in fields:
+                setattr(settings, key, value)
         self.save_config()
-    
+
     def update_bot_state(self, **kwargs) -> None:
         """Update bot state"""
+        state = self.config.bot_state
+        fields = self._STATE_FIELDS
         for key, value in kwargs.items():
-            if hasattr(self.config.bot_state, key):
-                setattr(self.config.bot_state, key, value)
+            if key in fields:
+                setattr(state, key, value)
         self.save_config()
     
     def set_private_key(self, private_key: str) -> None:
@@ -20,46 +20,43 @@ class PumpPortalMonitor:
         self.trade_callback: Optional[Callable] = None
     
     def set_new_token_callback(self, callback: Callable[[TokenInfo], None]):
-        """Set callback for new token events"""
+        """Set callback for new token events
+
+        The adapter closure is built once here and handed straight to the
+        original monitor, so each event costs one call frame instead of
+        going through an extra wrapper method.
+        """
         self.new_token_callback = callback
-        self.monitor.set_new_token_callback(self._on_new_token)
-    
+
+        def adapter(token_data):
+            try:
+                # Skip the field-by-field copy when upstream already emits our type
+                if type(token_data) is TokenInfo:
+                    token = token_data
+                else:
+                    # Convert to our TokenInfo format
+                    token = TokenInfo(
+                        mint=token_data.mint,
+                        symbol=token_data.symbol,
+                        name=token_data.name,
+                        price=token_data.price,
+                        market_cap=token_data.market_cap,
+                        liquidity=token_data.liquidity,
+                        holders=token_data.holders,
+                        created_timestamp=token_data.created_timestamp,
+                        is_on_pump=getattr(token_data, 'is_on_pump', False),
+                        source='pumpportal'
+                    )
+                callback(token)
+            except Exception as e:
+                logger.error(f"Error handling new token: {e}")
+
+        self.monitor.set_new_token_callback(adapter)
+
     def set_trade_callback(self, callback: Callable):
-        """Set callback for trade events"""
+        """Set callback for trade events (plumbed straight through)"""
         self.trade_callback = callback
-        self.monitor.set_trade_callback(self._on_trade)
-    
-    def _on_new_token(self, token_data):
-        """Handle new token from original monitor"""
-        try:
-            # Convert to our TokenInfo format
-            token = TokenInfo(
-                mint=token_data.mint,
-                symbol=token_data.symbol,
-                name=token_data.name,
-                price=token_data.price,
-                market_cap=token_data.market_cap,
-                liquidity=token_data.liquidity,
-                holders=token_data.holders,
-                created_timestamp=token_data.created_timestamp,
-                is_on_pump=token_data.is_on_pump if hasattr(token_data, 'is_on_pump') else False,
-                source='pumpportal'
-            )
-            
-            if self.new_token_callback:
-                self.new_token_callback(token)
-                
-        except Exception as e:
-            logger.error(f"Error handling new token: {e}")
-    
-    def _on_trade(self, trade_data):
-        """Handle trade from original monitor"""
-        try:
-            if self.trade_callback:
-                self.trade_callback(trade_data)
-                
-        except Exception as e:
-            logger.error(f"Error handling trade: {e}")
+        self.monitor.set_trade_callback(callback)
     
     async def start_monitoring(self):
         """Start monitoring"""
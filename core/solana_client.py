@@ -3,8 +3,11 @@ Solana Client - Simplified Solana blockchain interaction
 """
 
 import logging
-import base58
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import orjson
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solana.rpc.api import Client
@@ -13,33 +16,68 @@ from config import HELIUS_RPC_URL
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4096)
+def _to_pubkey(address: str) -> Pubkey:
+    """Convert a base58 address to a Pubkey, memoizing hot mints/wallets
+
+    The same mint shows up dozens of times during active trading; caching
+    turns the repeated base58 decode into a dict lookup. Bounded so
+    arbitrary input can't grow the cache without limit.
+    """
+    return Pubkey.from_string(address)
+
+
 class SolanaClient:
     """Simplified Solana client for wallet operations"""
-    
+
+    # Balance reads cluster around a single trade decision, so a short TTL
+    # coalesces the burst into one RPC call
+    BALANCE_TTL = 1.5
+    BATCH_TTL = 0.5
+
     def __init__(self, rpc_url: str = HELIUS_RPC_URL):
         self.rpc_url = rpc_url
-        self.rpc_client = Client(rpc_url)
-        self.async_client = AsyncClient(rpc_url)
+        # Clients are created on first use so instantiating SolanaClient
+        # doesn't pay for two HTTP client setups when only one (or neither)
+        # path is ever exercised
+        self.rpc_client: Optional[Client] = None
+        self.async_client: Optional[AsyncClient] = None
         self.keypair: Optional[Keypair] = None
         self.wallet_address: Optional[str] = None
-    
+        self._pubkey: Optional[Pubkey] = None
+        self._bal_cache = (0.0, 0.0)  # (monotonic timestamp, SOL value)
+        self._batch_cache = (0.0, (), {})  # (timestamp, pubkey tuple, result)
+
+    def _aclient(self) -> AsyncClient:
+        """Get the async RPC client, creating it on first use"""
+        if self.async_client is None:
+            self.async_client = AsyncClient(self.rpc_url)
+        return self.async_client
+
+    def _client(self) -> Client:
+        """Get the blocking RPC client, creating it on first use"""
+        if self.rpc_client is None:
+            self.rpc_client = Client(self.rpc_url)
+        return self.rpc_client
+
+
     def set_wallet(self, private_key: str) -> bool:
         """Set wallet from private key"""
         try:
             # Parse private key
             if private_key.startswith('[') and private_key.endswith(']'):
-                # JSON array format
-                import json
-                key_array = json.loads(private_key)
-                private_key_bytes = bytes(key_array)
+                # JSON array format (orjson decodes the int list in C)
+                self.keypair = Keypair.from_bytes(bytes(orjson.loads(private_key)))
             else:
-                # Base58 format
-                private_key_bytes = base58.b58decode(private_key)
-            
-            # Create keypair
-            self.keypair = Keypair.from_bytes(private_key_bytes)
-            self.wallet_address = str(self.keypair.pubkey())
-            
+                # Base58 format: solders decodes the string and builds the
+                # Ed25519 keypair entirely in native code
+                self.keypair = Keypair.from_base58_string(private_key)
+            # Derive the Pubkey and its base58 form once; downstream RPC
+            # calls reuse the object instead of re-encoding/re-parsing
+            self._pubkey = self.keypair.pubkey()
+            self.wallet_address = str(self._pubkey)
+
             logger.info(f"Wallet set: {self.wallet_address}")
             return True
             
@@ -51,24 +89,82 @@ class SolanaClient:
         """Clear wallet data"""
         self.keypair = None
         self.wallet_address = None
-    
+        self._pubkey = None
+
     def get_wallet_address(self) -> Optional[str]:
         """Get wallet address"""
         return self.wallet_address
+
+    def get_pubkey(self) -> Optional[Pubkey]:
+        """Get the cached wallet Pubkey object"""
+        return self._pubkey
     
+    async def get_sol_balance_async(self) -> float:
+        """Get SOL balance without blocking the event loop"""
+        try:
+            if not self.keypair:
+                return 0.0
+
+            ts, value = self._bal_cache
+            if time.monotonic() - ts < self.BALANCE_TTL:
+                return value
+
+            balance = await self._aclient().get_balance(self._pubkey)
+            value = balance.value / 1e9  # Convert lamports to SOL
+            self._bal_cache = (time.monotonic(), value)
+            return value
+
+        except Exception as e:
+            logger.error(f"Failed to get SOL balance: {e}")
+            return 0.0
+
     def get_sol_balance(self) -> float:
-        """Get SOL balance"""
+        """Get SOL balance (blocking; prefer get_sol_balance_async)"""
         try:
             if not self.keypair:
                 return 0.0
-            
-            balance = self.rpc_client.get_balance(self.keypair.pubkey())
-            return balance.value / 1e9  # Convert lamports to SOL
-            
+
+            ts, value = self._bal_cache
+            if time.monotonic() - ts < self.BALANCE_TTL:
+                return value
+
+            balance = self._client().get_balance(self._pubkey)
+            value = balance.value / 1e9  # Convert lamports to SOL
+            self._bal_cache = (time.monotonic(), value)
+            return value
+
         except Exception as e:
             logger.error(f"Failed to get SOL balance: {e}")
             return 0.0
     
+    async def get_balances_batch(self, pubkeys: List[str]) -> Dict[str, float]:
+        """Fetch lamport balances for several accounts in one RPC round trip
+
+        Uses getMultipleAccounts so checking the wallet plus its token
+        accounts costs a single request instead of one per account; repeat
+        requests for the same key set within BATCH_TTL reuse the last
+        response. Missing accounts map to 0.0.
+        """
+        try:
+            key = tuple(pubkeys)
+            ts, cached_key, cached = self._batch_cache
+            if cached_key == key and time.monotonic() - ts < self.BATCH_TTL:
+                return cached
+
+            resp = await self._aclient().get_multiple_accounts(
+                [_to_pubkey(p) for p in pubkeys]
+            )
+            result = {
+                p: (acct.lamports if acct else 0.0)
+                for p, acct in zip(pubkeys, resp.value)
+            }
+            self._batch_cache = (time.monotonic(), key, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to get batch balances: {e}")
+            return {}
+
     def is_wallet_set(self) -> bool:
         """Check if wallet is set"""
         return self.keypair is not None
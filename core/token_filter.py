@@ -3,11 +3,29 @@ Token Filter - Simplified token filtering service
 """
 
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, List
+
+import numpy as np
+
 from models.schemas import SniperConfig
 
 logger = logging.getLogger(__name__)
 
+
+def _filter_kernel(mc, liq, hld, min_mc, max_mc, min_liq, min_hld):
+    """Scalar filter core: pure numeric logic so numba can compile it"""
+    return (mc >= min_mc) & (mc <= max_mc) & (liq >= min_liq) & (hld >= min_hld)
+
+
+try:
+    # Optional JIT: erases the interpreter from the per-token decision when
+    # numba is installed; the pure-Python definition above is the fallback
+    from numba import njit
+    _filter_kernel = njit(cache=True, fastmath=True)(_filter_kernel)
+    _filter_kernel(0.0, 0.0, 0, 0.0, 0.0, 0.0, 0)  # warm the compile at import
+except ImportError:
+    pass
+
 class TokenFilterService:
     """Service for token filtering and configuration"""
     
@@ -24,7 +42,17 @@ class TokenFilterService:
             auto_buy=False,
             auto_sell=True
         )
-    
+        self._refresh_thresholds()
+
+    def _refresh_thresholds(self):
+        """Snapshot filter thresholds as plain floats for the hot paths"""
+        self._thresholds = (
+            float(self.config.min_market_cap),
+            float(self.config.max_market_cap),
+            float(self.config.min_liquidity),
+            int(self.config.min_holders),
+        )
+
     def get_current_config(self) -> SniperConfig:
         """Get current configuration"""
         return self.config
@@ -36,32 +64,40 @@ class TokenFilterService:
                 if hasattr(self.config, key):
                     setattr(self.config, key, value)
             
+            self._refresh_thresholds()
             logger.info("Token filter configuration updated")
-            
+
         except Exception as e:
-            logger.error(f"Failed to update configuration: {e}")
+            logger.error("Failed to update configuration: %s", e)
             raise
     
+    def should_trade_batch(self, tokens: List[Dict[str, Any]]) -> np.ndarray:
+        """Evaluate the filters for a batch of tokens at once
+
+        Bursts of new listings from the WebSocket firehose are screened with
+        three vectorized comparisons instead of per-token Python branching;
+        returns a boolean mask aligned with the input list.
+        """
+        min_mc, max_mc, min_liq, min_hld = self._thresholds
+        n = len(tokens)
+        mc = np.fromiter((t.get('market_cap', 0) for t in tokens), dtype=np.float64, count=n)
+        liq = np.fromiter((t.get('liquidity', 0) for t in tokens), dtype=np.float64, count=n)
+        hld = np.fromiter((t.get('holders', 0) for t in tokens), dtype=np.int64, count=n)
+        return (mc >= min_mc) & (mc <= max_mc) & (liq >= min_liq) & (hld >= min_hld)
+
     def should_trade_token(self, token_data: Dict[str, Any]) -> bool:
-        """Determine if a token should be traded based on filters"""
-        try:
-            # Apply market cap filter
-            market_cap = token_data.get('market_cap', 0)
-            if market_cap < self.config.min_market_cap or market_cap > self.config.max_market_cap:
-                return False
-            
-            # Apply liquidity filter
-            liquidity = token_data.get('liquidity', 0)
-            if liquidity < self.config.min_liquidity:
-                return False
-            
-            # Apply holders filter
-            holders = token_data.get('holders', 0)
-            if holders < self.config.min_holders:
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error checking token filters: {e}")
-            return False
+        """Determine if a token should be traded based on filters
+
+        No try/except here: the float()/int() coercion below is the input
+        validation, so the body can't raise on well-formed events and the
+        per-call exception-handler setup is avoided on the firehose path.
+        """
+        # Thresholds come from the snapshot tuple, not per-call config
+        # attribute lookups; missing/None fields coerce to zero
+        min_mc, max_mc, min_liq, min_hld = self._thresholds
+        return bool(_filter_kernel(
+            float(token_data.get('market_cap') or 0.0),
+            float(token_data.get('liquidity') or 0.0),
+            int(token_data.get('holders') or 0),
+            min_mc, max_mc, min_liq, min_hld,
+        ))
@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for the Omex Coin Sniper API
+
+Every endpoint is I/O-bound on external RPC/DB calls, so threaded (gthread)
+workers multiply throughput without any route changes. preload_app shares
+the imported solana/flask modules across forked workers to cut per-worker RSS.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# Set GUNICORN_WORKER_CLASS=gevent to multiplex the websocket-heavy
+# monitoring endpoints on greenlets (app.py monkey-patches accordingly)
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+# One worker: the sniper/monitoring/trading services hold all their state
+# in process memory, so a second worker would answer with its own (empty)
+# bot. Raise WEB_CONCURRENCY only once that state is externalized.
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+threads = int(os.getenv('GUNICORN_THREADS', 5))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+preload_app = True
+timeout = 60
+max_requests = 0
+
+
+def post_fork(server, worker):
+    """Restart per-process background threads lost in the preload fork"""
+    import app
+    app.start_log_listener()
@@ -16,7 +16,9 @@ class ServiceStatus(str, Enum):
     STOPPED = "stopped"
     ERROR = "error"
 
-@dataclass
+# slots=True: these models are created per event/row in the hot paths,
+# and slotted instances are smaller and faster to read than __dict__-backed ones.
+@dataclass(slots=True)
 class TokenInfo:
     """Token information model"""
     mint: str
@@ -35,7 +37,7 @@ class TokenInfo:
     telegram: Optional[str] = None
     website: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Trading position model"""
     mint: str
@@ -49,7 +51,7 @@ class Position:
     entry_time: datetime
     is_active: bool
 
-@dataclass
+@dataclass(slots=True)
 class TradeRequest:
     """Trade request model"""
     mint: str
@@ -58,7 +60,7 @@ class TradeRequest:
     slippage: Optional[float] = 5.0
     priority_fee: Optional[float] = 0.0001
 
-@dataclass
+@dataclass(slots=True)
 class TradeResponse:
     """Trade response model"""
     success: bool
@@ -67,7 +69,7 @@ class TradeResponse:
     price: Optional[float] = None
     message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SniperConfig:
     """Sniper configuration model"""
     sol_per_snipe: float
@@ -81,7 +83,7 @@ class SniperConfig:
     auto_buy: bool
     auto_sell: bool
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Health status model"""
     status: str
@@ -92,14 +94,14 @@ class HealthStatus:
     monitoring_active: bool
     active_positions: int
 
-@dataclass
+@dataclass(slots=True)
 class ErrorResponse:
     """Error response model"""
     error: str
     code: Optional[str] = None
     details: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class MonitoringConfig:
     """Monitoring configuration model"""
     enabled: bool
@@ -112,7 +114,7 @@ class MonitoringConfig:
     profit_target: float
     stop_loss: float
 
-@dataclass
+@dataclass(slots=True)
 class WalletInfo:
     """Wallet information model"""
     address: str
@@ -120,7 +122,7 @@ class WalletInfo:
     connected: bool
     last_updated: datetime
 
-@dataclass
+@dataclass(slots=True)
 class TradeHistory:
     """Trade history model"""
     signature: str
@@ -132,7 +134,7 @@ class TradeHistory:
     success: bool
     message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     """Market data model"""
     token: TokenInfo
@@ -141,7 +143,7 @@ class MarketData:
     price_change_percent_24h: float
     last_updated: datetime
 
-@dataclass
+@dataclass(slots=True)
 class SniperStats:
     """Sniper statistics model"""
     total_trades: int
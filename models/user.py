@@ -5,7 +5,7 @@ User and Authentication Models
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, EmailStr
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Float, ForeignKey, LargeBinary, BINARY
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 import hashlib
@@ -26,7 +26,9 @@ class User(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     last_login = Column(DateTime)
     
-    # Relationships
+    # Relationships stay lazy: the auth path loads single users constantly
+    # and must not drag wallets/sessions along. Listing endpoints opt into
+    # batched loading via DatabaseService.get_users_with_wallets.
     wallets = relationship("UserWallet", back_populates="user", cascade="all, delete-orphan")
     sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
 
@@ -53,7 +55,11 @@ class UserSession(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    token_hash = Column(String(255), unique=True, index=True, nullable=False)
+    # Raw SHA-256 bytes plus a short indexed prefix: the 8-byte prefix index
+    # packs far more entries per page than the old 64-char hex column, and the
+    # full digest is only compared after the index narrows the candidates
+    token_hash = Column(LargeBinary(32), unique=True, nullable=False)
+    token_hash_prefix = Column(BINARY(8), index=True, nullable=False)
     expires_at = Column(DateTime, nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -105,6 +111,19 @@ class UserResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_row(cls, user: "User") -> "UserResponse":
+        """Build from a trusted ORM row, skipping field re-validation"""
+        return cls.model_construct(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            is_admin=user.is_admin,
+            created_at=user.created_at,
+            last_login=user.last_login,
+        )
 
 class WalletCreate(BaseModel):
     wallet_name: str
@@ -120,6 +139,18 @@ class WalletResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_row(cls, wallet: "UserWallet") -> "WalletResponse":
+        """Build from a trusted ORM row, skipping field re-validation"""
+        return cls.model_construct(
+            id=wallet.id,
+            wallet_name=wallet.wallet_name,
+            wallet_address=wallet.wallet_address,
+            is_active=wallet.is_active,
+            created_at=wallet.created_at,
+            last_used=wallet.last_used,
+        )
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -143,3 +174,21 @@ class PositionResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_row(cls, position: "UserPosition") -> "PositionResponse":
+        """Build from a trusted ORM row, skipping field re-validation"""
+        return cls.model_construct(
+            id=position.id,
+            token_address=position.token_address,
+            token_symbol=position.token_symbol,
+            token_name=position.token_name,
+            buy_price=position.buy_price,
+            buy_amount=position.buy_amount,
+            current_price=position.current_price,
+            current_value=position.current_value,
+            pnl=position.pnl,
+            is_active=position.is_active,
+            created_at=position.created_at,
+            updated_at=position.updated_at,
+        )
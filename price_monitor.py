@@ -4,7 +4,7 @@ Real-time Price Monitor using WebSocket for token price updates
 """
 
 import asyncio
-import json
+import orjson
 import logging
 import websockets
 from typing import Dict, Set, Callable, Optional
@@ -13,6 +13,11 @@ from config import HELIUS_API_KEY
 
 logger = logging.getLogger(__name__)
 
+# Static halves of the Helius accountSubscribe frames, built once at import.
+_TPL_ACCOUNT_SUB = {"jsonrpc": "2.0", "id": 1, "method": "accountSubscribe"}
+_TPL_ACCOUNT_UNSUB = {"jsonrpc": "2.0", "id": 2, "method": "accountUnsubscribe"}
+_SUB_CONFIG = {"encoding": "jsonParsed", "commitment": "confirmed"}
+
 class PriceMonitor:
     """WebSocket-based price monitor for real-time token price updates"""
     
@@ -24,6 +29,8 @@ class PriceMonitor:
         self.subscribed_accounts: Set[str] = set()
         self.price_callbacks: Dict[str, Callable] = {}
         self.monitoring_task = None
+        # Bounded hand-off between the receive loop and the processing worker
+        self._message_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
         
     async def connect(self):
         """Connect to Helius WebSocket"""
@@ -58,20 +65,10 @@ class PriceMonitor:
                 await self.connect()
             
             # Subscribe to account changes
-            subscribe_message = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "accountSubscribe",
-                "params": [
-                    mint_address,
-                    {
-                        "encoding": "jsonParsed",
-                        "commitment": "confirmed"
-                    }
-                ]
-            }
+            subscribe_message = {**_TPL_ACCOUNT_SUB, "params": [mint_address, _SUB_CONFIG]}
             
-            await self.websocket.send(json.dumps(subscribe_message))
+            # orjson encodes in C; .decode() keeps the frame a text frame
+            await self.websocket.send(orjson.dumps(subscribe_message).decode())
             self.subscribed_accounts.add(mint_address)
             self.price_callbacks[mint_address] = callback
             
@@ -85,14 +82,9 @@ class PriceMonitor:
         try:
             if mint_address in self.subscribed_accounts:
                 # Unsubscribe message
-                unsubscribe_message = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "accountUnsubscribe",
-                    "params": [mint_address]
-                }
+                unsubscribe_message = {**_TPL_ACCOUNT_UNSUB, "params": [mint_address]}
                 
-                await self.websocket.send(json.dumps(unsubscribe_message))
+                await self.websocket.send(orjson.dumps(unsubscribe_message).decode())
                 self.subscribed_accounts.discard(mint_address)
                 
                 if mint_address in self.price_callbacks:
@@ -104,27 +96,51 @@ class PriceMonitor:
             logger.error(f"❌ Error unsubscribing from token {mint_address}: {e}")
     
     async def _monitor_messages(self):
-        """Monitor incoming WebSocket messages"""
+        """Monitor incoming WebSocket messages
+
+        The receiver and the processor run as separate tasks joined by a
+        bounded queue, so the socket keeps draining while callbacks run —
+        a slow callback no longer backs up the WebSocket during bursts.
+        """
         try:
-            while self.is_connected and self.websocket:
-                try:
-                    message = await self.websocket.recv()
-                    await self._process_message(message)
-                except websockets.exceptions.ConnectionClosed:
-                    logger.warning("⚠️ WebSocket connection closed, attempting to reconnect...")
-                    await self._reconnect()
-                except Exception as e:
-                    logger.error(f"❌ Error processing WebSocket message: {e}")
-                    
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._receive_messages())
+                tg.create_task(self._process_queued_messages())
         except asyncio.CancelledError:
             logger.info("🛑 Price monitoring task cancelled")
         except Exception as e:
             logger.error(f"❌ Error in price monitoring task: {e}")
     
+    async def _receive_messages(self):
+        """Drain the WebSocket into the message queue"""
+        while self.is_connected and self.websocket:
+            try:
+                message = await self.websocket.recv()
+            except websockets.exceptions.ConnectionClosed:
+                logger.warning("⚠️ WebSocket connection closed, attempting to reconnect...")
+                await self._reconnect()
+                return
+            try:
+                self._message_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Dropping the oldest update beats falling behind the socket
+                self._message_queue.get_nowait()
+                self._message_queue.put_nowait(message)
+                logger.warning("⚠️ Price message queue full, dropped oldest update")
+    
+    async def _process_queued_messages(self):
+        """Parse and dispatch messages pulled off the queue"""
+        while self.is_connected:
+            message = await self._message_queue.get()
+            try:
+                await self._process_message(message)
+            except Exception as e:
+                logger.error(f"❌ Error processing WebSocket message: {e}")
+    
     async def _process_message(self, message: str):
         """Process incoming WebSocket message"""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)  # accepts str or raw bytes
             
             # Handle subscription confirmation
             if 'result' in data and isinstance(data['result'], int):
@@ -143,7 +159,7 @@ class PriceMonitor:
                     if account_address in self.subscribed_accounts:
                         await self._handle_token_update(account_address, account_data)
                         
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("⚠️ Invalid JSON message received")
         except Exception as e:
             logger.error(f"❌ Error processing message: {e}")
@@ -127,7 +127,7 @@ class AuthService:
                 'access_token': token,
                 'token_type': 'bearer',
                 'expires_in': 1800,  # 30 minutes
-                'user': UserResponse.from_orm(user)
+                'user': UserResponse.from_row(user)
             }
             
         except Exception as e:
@@ -175,7 +175,7 @@ class AuthService:
             
             return {
                 'success': True,
-                'user': UserResponse.from_orm(user)
+                'user': UserResponse.from_row(user)
             }
             
         except Exception as e:
@@ -5,14 +5,15 @@ Database Service for Multi-User Support
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text, Float, ForeignKey
+from sqlalchemy import create_engine, event, inspect, Column, Integer, String, DateTime, Boolean, Text, Float, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 import secrets
 import hashlib
+import hmac
 import base64
 from cryptography.fernet import Fernet
 import os
@@ -27,8 +28,10 @@ SECRET_KEY = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing — bcrypt at an explicit cost of 12 (~100-300ms): slow
+# enough to gut offline brute-force throughput, and only paid once per login
+# since subsequent requests ride the indexed session-token lookup instead
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
 # Encryption for private keys
 def get_encryption_key():
@@ -46,19 +49,66 @@ class DatabaseService:
     """Database service for multi-user support"""
     
     def __init__(self):
-        self.engine = create_engine(DATABASE_URL)
+        if DATABASE_URL.startswith("sqlite"):
+            # Pool connections instead of reopening the file per session, and
+            # allow them to hop threads (each PRAGMA below is per-connection)
+            self.engine = create_engine(
+                DATABASE_URL,
+                pool_size=16,
+                connect_args={"check_same_thread": False}
+            )
+            event.listens_for(self.engine, "connect")(self._tune_sqlite_connection)
+        else:
+            self.engine = create_engine(DATABASE_URL)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.create_tables()
     
+    @staticmethod
+    def _tune_sqlite_connection(dbapi_connection, connection_record):
+        """Apply SQLite pragmas on every new pooled connection.
+
+        WAL lets readers proceed while a write is in flight instead of
+        serializing everything behind the single write lock.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+    
     def create_tables(self):
         """Create database tables"""
         try:
             from models.user import Base
+            self._migrate_session_table()
             Base.metadata.create_all(bind=self.engine)
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating database tables: {e}")
     
+    def _migrate_session_table(self):
+        """Rebuild user_sessions if it predates the binary token_hash schema.
+
+        create_all never alters existing tables, so databases created before
+        token_hash became LargeBinary(32) (plus the token_hash_prefix index
+        column) would fail every session insert and lookup. Sessions are
+        30-minute JWTs, so the migration simply drops the old table and lets
+        create_all rebuild it — existing sessions are invalidated and users
+        log in again.
+        """
+        inspector = inspect(self.engine)
+        if not inspector.has_table("user_sessions"):
+            return
+        columns = {col["name"]: col for col in inspector.get_columns("user_sessions")}
+        token_type = str(columns.get("token_hash", {}).get("type", ""))
+        if "token_hash_prefix" in columns and "CHAR" not in token_type.upper():
+            return
+        logger.warning("Rebuilding user_sessions for the binary token_hash schema (existing sessions invalidated)")
+        UserSession.__table__.drop(bind=self.engine)
+    
     def get_db(self) -> Session:
         """Get database session"""
         db = self.SessionLocal()
@@ -100,7 +150,7 @@ class DatabaseService:
             db.refresh(user)
             
             logger.info(f"User created: {user.username}")
-            return UserResponse.from_orm(user)
+            return UserResponse.from_row(user)
             
         except Exception as e:
             logger.error(f"Error creating user: {e}")
@@ -143,6 +193,23 @@ class DatabaseService:
         finally:
             self.close_db(db)
     
+    def get_users_with_wallets(self) -> List[User]:
+        """Get all active users with wallets and positions eagerly loaded.
+
+        Uses selectinload so the whole traversal costs three queries total
+        (users, wallets, positions) regardless of how many users there are.
+        """
+        db = self.get_db()
+        try:
+            return db.query(User).filter(User.is_active == True).options(
+                selectinload(User.wallets).selectinload(UserWallet.positions)
+            ).all()
+        except Exception as e:
+            logger.error(f"Error getting users with wallets: {e}")
+            return []
+        finally:
+            self.close_db(db)
+    
     # Wallet Management
     def create_wallet(self, user_id: int, wallet_data: WalletCreate) -> Optional[WalletResponse]:
         """Create user wallet"""
@@ -153,11 +220,11 @@ class DatabaseService:
             encrypted_key_b64 = base64.b64encode(encrypted_key).decode()
             
             # Get wallet address from private key
-            import base58
+            import based58
             from solders.keypair import Keypair
-            
+
             try:
-                decoded_key = base58.b58decode(wallet_data.private_key)
+                decoded_key = based58.b58decode(wallet_data.private_key.encode())
                 keypair = Keypair.from_bytes(decoded_key)
                 wallet_address = str(keypair.pubkey())
             except Exception as e:
@@ -186,7 +253,7 @@ class DatabaseService:
             db.refresh(wallet)
             
             logger.info(f"Wallet created for user {user_id}: {wallet_address}")
-            return WalletResponse.from_orm(wallet)
+            return WalletResponse.from_row(wallet)
             
         except Exception as e:
             logger.error(f"Error creating wallet: {e}")
@@ -204,7 +271,7 @@ class DatabaseService:
                 UserWallet.is_active == True
             ).all()
             
-            return [WalletResponse.from_orm(wallet) for wallet in wallets]
+            return [WalletResponse.from_row(wallet) for wallet in wallets]
             
         except Exception as e:
             logger.error(f"Error getting user wallets: {e}")
@@ -249,13 +316,14 @@ class DatabaseService:
             }
             token = jwt.encode(token_data, SECRET_KEY, algorithm=ALGORITHM)
             
-            # Hash token for storage
-            token_hash = hashlib.sha256(token.encode()).hexdigest()
+            # Hash token for storage (raw digest, half the size of hex)
+            token_hash = hashlib.sha256(token.encode()).digest()
             
             # Create session
             session = UserSession(
                 user_id=user_id,
                 token_hash=token_hash,
+                token_hash_prefix=token_hash[:8],
                 expires_at=datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
             )
             
@@ -270,6 +338,21 @@ class DatabaseService:
         finally:
             self.close_db(db)
     
+    @staticmethod
+    def _find_session(db: Session, token_hash: bytes) -> Optional[UserSession]:
+        """Look up a session by its token hash.
+
+        The indexed 8-byte prefix narrows the candidates, then the full
+        digest is checked with hmac.compare_digest (constant-time).
+        """
+        candidates = db.query(UserSession).filter(
+            UserSession.token_hash_prefix == token_hash[:8]
+        ).all()
+        for session in candidates:
+            if hmac.compare_digest(session.token_hash, token_hash):
+                return session
+        return None
+    
     def verify_token(self, token: str) -> Optional[User]:
         """Verify JWT token"""
         try:
@@ -282,14 +365,10 @@ class DatabaseService:
             # Check if session exists and is active
             db = self.get_db()
             try:
-                token_hash = hashlib.sha256(token.encode()).hexdigest()
-                session = db.query(UserSession).filter(
-                    UserSession.token_hash == token_hash,
-                    UserSession.is_active == True,
-                    UserSession.expires_at > datetime.utcnow()
-                ).first()
+                token_hash = hashlib.sha256(token.encode()).digest()
+                session = self._find_session(db, token_hash)
                 
-                if not session:
+                if not session or not session.is_active or session.expires_at <= datetime.utcnow():
                     return None
                 
                 # Update last used
@@ -314,10 +393,8 @@ class DatabaseService:
         try:
             db = self.get_db()
             try:
-                token_hash = hashlib.sha256(token.encode()).hexdigest()
-                session = db.query(UserSession).filter(
-                    UserSession.token_hash == token_hash
-                ).first()
+                token_hash = hashlib.sha256(token.encode()).digest()
+                session = self._find_session(db, token_hash)
                 
                 if session:
                     session.is_active = False
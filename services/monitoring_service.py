@@ -116,25 +116,17 @@ class MonitoringService:
         try:
             # Get current configuration
             config = self.filter_service.get_current_config()
-            
-            # Apply market cap filter
-            if token.market_cap < config.min_market_cap or token.market_cap > config.max_market_cap:
-                return False
-            
-            # Apply liquidity filter
-            if token.liquidity < config.min_liquidity:
-                return False
-            
-            # Apply holders filter
-            if token.holders < config.min_holders:
-                return False
-            
-            # Check if auto buy is enabled
-            if not config.auto_buy:
-                return False
-            
-            return True
-            
+
+            # Single compare-and-AND sequence (non-short-circuit `&`) instead
+            # of a chain of ifs the branch predictor keeps missing on the
+            # heterogeneous token stream
+            return bool(
+                (config.min_market_cap <= token.market_cap <= config.max_market_cap)
+                & (token.liquidity >= config.min_liquidity)
+                & (token.holders >= config.min_holders)
+                & config.auto_buy
+            )
+
         except Exception as e:
             logger.error(f"Error checking token filters: {e}")
             return False
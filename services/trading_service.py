@@ -23,7 +23,16 @@ class TradingService:
     def get_positions(self) -> List[Position]:
         """Get all current positions"""
         return list(self.positions.values())
-    
+
+    def iter_positions(self):
+        """Iterate a point-in-time snapshot of current positions
+
+        The copy is deliberate: responses stream row by row, and a trade
+        landing mid-stream must not mutate the dict under the iterator.
+        """
+        yield from list(self.positions.values())
+
+
     def get_position(self, mint: str) -> Optional[Position]:
         """Get a specific position by mint address"""
         return self.positions.get(mint)
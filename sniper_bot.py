@@ -7,12 +7,14 @@ Integrates PumpPortal monitoring with Helius RPC trading
 import asyncio
 import logging
 import base58
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Callable, Dict, List, Any
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solana.rpc.async_api import AsyncClient
 from dataclasses import dataclass
-from datetime import datetime
 import time
 
 from config import config_manager, HELIUS_RPC_URL
@@ -21,14 +23,24 @@ from pumpportal_trader import PumpPortalTrader
 from token_filter_service import TokenFilterService
 from helius_api import HeliusAPI
 
-# Configure logging
+# Configure logging. Event-loop and WebSocket threads only enqueue records;
+# a background listener thread does the formatting and stream I/O, so log
+# bursts never block trade handling and writes stay single-threaded.
 logging.basicConfig(
     level=logging.DEBUG,  # Changed to DEBUG for more details
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+if not any(isinstance(h, QueueHandler) for h in logging.root.handlers):
+    _log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(_log_queue, *logging.root.handlers, respect_handler_level=True)
+    logging.root.handlers = [QueueHandler(_log_queue)]
+    _log_listener.start()
 logger = logging.getLogger(__name__)
 
-@dataclass
+# slots=True: positions are read field-by-field on every price tick and
+# snapshot, so dropping the per-instance __dict__ speeds those lookups
+# and shrinks each object
+@dataclass(slots=True)
 class Position:
     """Represents an active token position"""
     token_mint: str
@@ -59,18 +71,29 @@ class Position:
 
 class SniperBot:
     """Main sniper bot class"""
-    
+
+    # Balance checks cluster around trades and status polls; a short TTL
+    # turns those bursts into one RPC call
+    BALANCE_CACHE_TTL = 2.0
+
     def __init__(self):
         """Initialize the sniper bot"""
         self.keypair = None
+        self._balance_cache = (0.0, None)  # (monotonic timestamp, SOL value)
+        self._settings_payload = None  # status 'settings' dict, rebuilt on change
         self.trader = PumpPortalTrader()
         self.monitor = PumpFunMonitor()
         self.token_filter = TokenFilterService(helius_rpc_url=HELIUS_RPC_URL)
         self.positions: Dict[str, Position] = {}
         self.ui_callback: Optional[Callable] = None
         self.buy_activity_monitoring_task = None
-        # Ensure trade history always exists before any later initialization may fail
-        self.trade_history: List[Dict[str, Any]] = []
+        # Ensure trade history always exists before any later initialization may fail;
+        # bounded so long sessions can't grow it (and appends stay O(1)).
+        # The revision counter bumps on every mutation: once the deque is
+        # full its id and len stop changing, so downstream memoization
+        # keys on the revision instead.
+        self.trade_history: deque = deque(maxlen=1000)
+        self.trade_history_rev: int = 0
         # Serialize auto-buys to respect max_positions and avoid race conditions
         self._buy_lock: asyncio.Lock = asyncio.Lock()
         # New: track concurrent auto-buys and a queue when at capacity
@@ -85,6 +108,10 @@ class SniperBot:
         # Add cancellation flag for historical token loading
         self._historical_loading_cancelled = False
         self._historical_loading_task = None
+
+        # Event loop the bot runs on (set in start_monitoring); used to
+        # dispatch coroutines from threads that have no loop of their own
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Initialize Helius API
         self.helius_api = HeliusAPI()
@@ -122,7 +149,7 @@ class SniperBot:
                         'sol_amount': settings.sol_per_snipe,
                         'status': 'success',
                         'message': 'Transaction successful!',
-                        'timestamp': int(datetime.now().timestamp())
+                        'timestamp': int(time.time())
                     })
                 else:
                     self.ui_callback('auto_buy_error', {
@@ -132,7 +159,7 @@ class SniperBot:
                         'status': 'failed',
                         'error': 'buy_failed',
                         'message': f'Auto-buy failed for {token.symbol}',
-                        'timestamp': int(datetime.now().timestamp())
+                        'timestamp': int(time.time())
                     })
                     
         except Exception as e:
@@ -148,7 +175,7 @@ class SniperBot:
                     'status': 'error',
                     'error': 'exception',
                     'message': error_msg,
-                    'timestamp': int(datetime.now().timestamp())
+                    'timestamp': int(time.time())
                 })
         finally:
             async with self._autobuy_state_lock:
@@ -259,6 +286,33 @@ class SniperBot:
     
     def get_bot_status(self) -> dict:
         """Get current bot status"""
+        if self._settings_payload is None:
+            # Built once per settings change rather than 22 config attribute
+            # walks on every status poll / client connect
+            settings = config_manager.config.bot_settings
+            self._settings_payload = {
+                'sol_per_snipe': settings.sol_per_snipe,
+                'max_positions': settings.max_positions,
+                'profit_target_percent': settings.profit_target_percent,
+                'stop_loss_percent': settings.stop_loss_percent,
+                'min_market_cap': settings.min_market_cap,
+                'max_market_cap': settings.max_market_cap,
+                'min_liquidity': settings.min_liquidity,
+                'min_holders': settings.min_holders,
+                'auto_buy': settings.auto_buy,
+                'auto_sell': settings.auto_sell,
+                'sell_strategy': settings.sell_strategy,
+                'sell_after_buys': settings.sell_after_buys,
+                'sell_after_seconds': getattr(settings, 'sell_after_seconds', 18000),
+                'token_age_filter': settings.token_age_filter,
+                'custom_days': settings.custom_days,
+                'include_pump_tokens': settings.include_pump_tokens,
+                'transaction_type': settings.transaction_type,
+                'priority_fee': settings.priority_fee,
+                'historical_batch_size': settings.historical_batch_size,
+                'quick_mode': settings.quick_mode,
+                'quick_mode_batch_size': settings.quick_mode_batch_size,
+            }
         return {
             'is_running': config_manager.config.bot_state.is_running,
             'has_private_key': config_manager.has_private_key(),
@@ -268,35 +322,14 @@ class SniperBot:
             'total_pnl': config_manager.config.bot_state.total_pnl,
             # Iterate over position objects, not dict keys
             'active_positions': sum(1 for p in self.positions.values() if p.is_active),
-            'settings': {
-                'sol_per_snipe': config_manager.config.bot_settings.sol_per_snipe,
-                'max_positions': config_manager.config.bot_settings.max_positions,
-                'profit_target_percent': config_manager.config.bot_settings.profit_target_percent,
-                'stop_loss_percent': config_manager.config.bot_settings.stop_loss_percent,
-                'min_market_cap': config_manager.config.bot_settings.min_market_cap,
-                'max_market_cap': config_manager.config.bot_settings.max_market_cap,
-                'min_liquidity': config_manager.config.bot_settings.min_liquidity,
-                'min_holders': config_manager.config.bot_settings.min_holders,
-                'auto_buy': config_manager.config.bot_settings.auto_buy,
-                'auto_sell': config_manager.config.bot_settings.auto_sell,
-                'sell_strategy': config_manager.config.bot_settings.sell_strategy,
-                'sell_after_buys': config_manager.config.bot_settings.sell_after_buys,
-                'sell_after_seconds': getattr(config_manager.config.bot_settings, 'sell_after_seconds', 18000),
-                'token_age_filter': config_manager.config.bot_settings.token_age_filter,
-                'custom_days': config_manager.config.bot_settings.custom_days,
-                'include_pump_tokens': config_manager.config.bot_settings.include_pump_tokens,
-                'transaction_type': config_manager.config.bot_settings.transaction_type,
-                'priority_fee': config_manager.config.bot_settings.priority_fee,
-                'historical_batch_size': config_manager.config.bot_settings.historical_batch_size,
-                'quick_mode': config_manager.config.bot_settings.quick_mode,
-                'quick_mode_batch_size': config_manager.config.bot_settings.quick_mode_batch_size,
-            }
+            'settings': self._settings_payload
         }
-    
+
     def update_settings(self, settings: dict) -> bool:
         """Update bot settings"""
         try:
             config_manager.update_bot_settings(**settings)
+            self._settings_payload = None  # rebuild on next status read
             logger.info(f"⚙️ Settings updated: {settings}")
             return True
         except Exception as e:
@@ -333,26 +366,31 @@ class SniperBot:
             return False
 
     def get_positions_snapshot(self) -> List[Dict[str, Any]]:
-        """Return a serializable snapshot of current in-memory positions."""
+        """Return a serializable snapshot of current in-memory positions.
+
+        Position is a dataclass, so every field below is guaranteed to
+        exist — direct attribute reads replace the old per-field getattr
+        calls (only 'signature' is not a declared field).
+        """
         try:
             snapshot: List[Dict[str, Any]] = []
             for mint, pos in self.positions.items():
                 # Only include active positions
-                if not getattr(pos, 'is_active', True):
+                if not pos.is_active:
                     continue
                 snapshot.append({
                     'mint': mint,
-                    'token_mint': getattr(pos, 'token_mint', mint),
-                    'token_symbol': getattr(pos, 'token_symbol', 'Unknown'),
-                    'token_name': getattr(pos, 'token_name', 'Unknown'),
-                    'entry_price': getattr(pos, 'entry_price', 0.0),
-                    'current_price': getattr(pos, 'current_price', 0.0),
-                    'token_amount': getattr(pos, 'token_amount', 0.0),
-                    'sol_amount': getattr(pos, 'sol_amount', 0.0),
-                    'current_pnl': getattr(pos, 'current_pnl', getattr(pos, 'pnl_sol', 0.0) or 0.0),
-                    'current_pnl_percent': getattr(pos, 'current_pnl_percent', getattr(pos, 'pnl_percent', 0.0) or 0.0),
-                    'is_active': getattr(pos, 'is_active', True),
-                    'entry_timestamp': getattr(pos, 'entry_timestamp', getattr(pos, 'entry_time', 0) or 0),
+                    'token_mint': pos.token_mint,
+                    'token_symbol': pos.token_symbol,
+                    'token_name': pos.token_name,
+                    'entry_price': pos.entry_price,
+                    'current_price': pos.current_price,
+                    'token_amount': pos.token_amount,
+                    'sol_amount': pos.sol_amount,
+                    'current_pnl': pos.current_pnl or pos.pnl_sol or 0.0,
+                    'current_pnl_percent': pos.current_pnl_percent or pos.pnl_percent or 0.0,
+                    'is_active': pos.is_active,
+                    'entry_timestamp': pos.entry_timestamp or pos.entry_time or 0,
                     'signature': getattr(pos, 'signature', None)
                 })
             return snapshot
@@ -723,7 +761,11 @@ class SniperBot:
         """Start monitoring for new tokens and trading opportunities"""
         try:
             logger.info("🚀 Starting sniper bot monitoring...")
-            
+
+            # Remember the bot's event loop so sync callbacks fired from
+            # WebSocket threads can schedule coroutines onto it
+            self._loop = asyncio.get_running_loop()
+
             # Update bot state
             config_manager.update_bot_state(is_running=True)
             
@@ -1057,7 +1099,7 @@ class SniperBot:
                     'sol_amount': settings.sol_per_snipe,
                     'status': 'creating',
                     'message': 'Creating transaction...',
-                    'timestamp': int(datetime.now().timestamp())
+                    'timestamp': int(time.time())
                 })
             
             # Run via helper that guarantees slot release and queue drain, even on error
@@ -1315,8 +1357,11 @@ class SniperBot:
                         if should_sell:
                             logger.info(f"🎯 {sell_reason} reached for {position.token_symbol or mint} - Selling!")
                             await self.sell_token(mint)
-                
-                await asyncio.sleep(10)  # Check every 10 seconds
+
+                # Adaptive poll: check tightly while positions are open, back
+                # off when there is nothing to watch so idle CPU stays near 0
+                has_active = any(p.is_active for p in self.positions.values())
+                await asyncio.sleep(2 if has_active else 15)
                 
         except asyncio.CancelledError:
             logger.info("📊 Position monitoring stopped")
@@ -1344,7 +1389,7 @@ class SniperBot:
                     position.buy_count_since_entry += 1
                     position.last_buy_timestamp = int(time.time())
                     
-                    logger.info(f"📈 New buyer detected for {mint}: {buyer} (Total buyers since entry: {position.buy_count_since_entry})")
+                    logger.info("📈 New buyer detected for %s: %s (Total buyers since entry: %s)", mint, buyer, position.buy_count_since_entry)
                     
                     # Check if we should sell based on strategy
                     settings = config_manager.config.bot_settings
@@ -1364,19 +1409,42 @@ class SniperBot:
                         if position.entry_price > 0 and position.current_price > 0:
                             pnl_percent = ((position.current_price - position.entry_price) / position.entry_price) * 100
                             if pnl_percent >= settings.profit_target_percent:
-                                logger.info(f"🎯 Profit target reached on trade activity for {mint}: {pnl_percent:.1f}%")
+                                logger.info("🎯 Profit target reached on trade activity for %s: %.1f%%", mint, pnl_percent)
                                 await self._execute_sell(mint, f"profit target {settings.profit_target_percent}%")
                             elif pnl_percent <= -settings.stop_loss_percent:
-                                logger.info(f"🛑 Stop loss triggered on trade activity for {mint}: {pnl_percent:.1f}%")
+                                logger.info("🛑 Stop loss triggered on trade activity for %s: %.1f%%", mint, pnl_percent)
                                 await self._execute_sell(mint, f"stop loss {settings.stop_loss_percent}%")
                         
         except Exception as e:
             logger.error(f"❌ Error handling trade activity: {e}")
     
+    def _schedule_sell(self, mint: str):
+        """Schedule sell_token from any thread without spinning up a loop
+
+        WebSocket callbacks run on threads with no event loop, where
+        asyncio.create_task raises and asyncio.run would block the message
+        thread on a throwaway loop. Submit to the bot loop instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop and not self._loop.is_closed():
+                fut = asyncio.run_coroutine_threadsafe(self.sell_token(mint), self._loop)
+                fut.add_done_callback(
+                    lambda f: logger.error("❌ Scheduled sell failed for %s: %s", mint, f.exception())
+                    if f.exception() else None
+                )
+            else:
+                logger.error("❌ No bot event loop available to schedule sell for %s", mint)
+            return
+        asyncio.create_task(self.sell_token(mint))
+
     def _handle_price_update(self, mint: str, price_sol: float, price_usd: float):
         """Handle price updates from websocket"""
         try:
-            logger.info(f"💰 Price update received for {mint}: {price_sol:.12f} SOL (${price_usd:.8f})")
+            # %-style on the per-tick path: the float formatting runs in C
+            # via str.__mod__ and only when INFO is actually enabled
+            logger.info("💰 Price update received for %s: %.12f SOL ($%.8f)", mint, price_sol, price_usd)
             
             # Check if we have a position for this token
             if mint in self.positions and self.positions[mint].is_active:
@@ -1394,27 +1462,19 @@ class SniperBot:
                     position.pnl_sol = pnl_sol
                     position.pnl_percent = pnl_percent
                     
-                    logger.info(f"💰 P&L Update for {mint}:")
-                    logger.info(f"   Entry: {position.entry_price:.12f} SOL, Current: {price_sol:.12f} SOL")
-                    logger.info(f"   P&L: {pnl_sol:.6f} SOL ({pnl_percent:+.2f}%)")
+                    logger.info("💰 P&L Update for %s:", mint)
+                    logger.info("   Entry: %.12f SOL, Current: %.12f SOL", position.entry_price, price_sol)
+                    logger.info("   P&L: %.6f SOL (%+.2f%%)", pnl_sol, pnl_percent)
 
                     # Enforce TP/SL immediately on price update
                     settings = config_manager.config.bot_settings
                     if settings.auto_sell:
                         if pnl_percent >= settings.profit_target_percent:
-                            logger.info(f"🎯 Profit target reached on price update for {mint}: {pnl_percent:.1f}%")
-                            try:
-                                loop = asyncio.get_running_loop()
-                                asyncio.create_task(self.sell_token(mint))
-                            except RuntimeError:
-                                asyncio.run(self.sell_token(mint))
+                            logger.info("🎯 Profit target reached on price update for %s: %.1f%%", mint, pnl_percent)
+                            self._schedule_sell(mint)
                         elif pnl_percent <= -settings.stop_loss_percent:
-                            logger.info(f"🛑 Stop loss triggered on price update for {mint}: {pnl_percent:.1f}%")
-                            try:
-                                loop = asyncio.get_running_loop()
-                                asyncio.create_task(self.sell_token(mint))
-                            except RuntimeError:
-                                asyncio.run(self.sell_token(mint))
+                            logger.info("🛑 Stop loss triggered on price update for %s: %.1f%%", mint, pnl_percent)
+                            self._schedule_sell(mint)
                     
                     # Update UI with price and P&L update (always include position metadata as backup)
                     if self.ui_callback:
@@ -1433,11 +1493,11 @@ class SniperBot:
                             'token_name': position.token_name,
                             'sol_amount': position.sol_amount
                         })
-                        logger.info(f"📱 Sent price update to UI for {mint} (with backup metadata: entry_price={position.entry_price}, token_amount={position.token_amount})")
+                        logger.info("📱 Sent price update to UI for %s (with backup metadata: entry_price=%s, token_amount=%s)", mint, position.entry_price, position.token_amount)
                 else:
-                    logger.info(f"💰 Price updated for {mint} but no entry price available yet")
+                    logger.info("💰 Price updated for %s but no entry price available yet", mint)
             else:
-                logger.info(f"💰 Price update for {mint} but no active position found")
+                logger.info("💰 Price update for %s but no active position found", mint)
                 
         except Exception as e:
             logger.error(f"❌ Error handling price update: {e}")
@@ -1447,12 +1507,12 @@ class SniperBot:
     async def _handle_pumpportal_trade(self, trade_info):
         """Handle trade events from PumpPortal WebSocket"""
         try:
-            logger.info(f"🔄 _handle_pumpportal_trade called with trade_info: {trade_info}")
-            logger.info(f"📊 Trade mint: {trade_info.mint}")
-            logger.info(f"📊 Trade trader: {trade_info.trader}")
-            logger.info(f"📊 Trade is_buy: {trade_info.is_buy}")
-            logger.info(f"📊 Trade amount: {trade_info.amount}")
-            logger.info(f"📊 Trade token_amount: {trade_info.token_amount}")
+            logger.info("🔄 _handle_pumpportal_trade called with trade_info: %s", trade_info)
+            logger.info("📊 Trade mint: %s", trade_info.mint)
+            logger.info("📊 Trade trader: %s", trade_info.trader)
+            logger.info("📊 Trade is_buy: %s", trade_info.is_buy)
+            logger.info("📊 Trade amount: %s", trade_info.amount)
+            logger.info("📊 Trade token_amount: %s", trade_info.token_amount)
             
             # Convert TradeInfo to dictionary for compatibility with existing code
             trade_data = {
@@ -1467,14 +1527,12 @@ class SniperBot:
                 'price': trade_info.price
             }
             
-            # Store trade in history (guard against missing attribute)
-            if not hasattr(self, 'trade_history') or self.trade_history is None:
-                self.trade_history = []
+            # Store trade in history (guard against missing attribute); the
+            # deque's maxlen evicts the oldest trade instead of re-slicing
+            if getattr(self, 'trade_history', None) is None:
+                self.trade_history = deque(maxlen=1000)
             self.trade_history.append(trade_data)
-            
-            # Keep only last 1000 trades to prevent memory issues
-            if len(self.trade_history) > 1000:
-                self.trade_history = self.trade_history[-1000:]
+            self.trade_history_rev += 1
             
             mint = trade_data['mint']
             tx_type = trade_data['txType']
@@ -1603,22 +1661,28 @@ class SniperBot:
                 position = self.positions[mint]
                 
                 # Backfill missing token_amount from trade stream if we don't have it yet
+                backfilled = False
                 try:
                     if (position.token_amount is None or position.token_amount <= 0) and trade_info.token_amount and trade_info.token_amount > 0:
                         position.token_amount = trade_info.token_amount
+                        backfilled = True
                         logger.info(f"✅ Backfilled token_amount for {mint} from trade update: {position.token_amount:,.0f}")
                         # Also update the last transaction entry in the UI with real token amount
                         await self._update_transaction_with_token_amount(mint, position.token_amount)
-                        # Notify UI of metadata update (no entry_price change)
-                        if self.ui_callback:
-                            self.ui_callback('position_update', {
-                                'action': 'metadata_update',
-                                'mint': mint,
-                                'token_amount': position.token_amount
-                            })
                 except Exception as backfill_err:
                     logger.warning(f"⚠️ Could not backfill token_amount for {mint}: {backfill_err}")
 
+                # A price update below carries the backfilled amount in the
+                # same frame; only send a standalone metadata update when no
+                # price frame will follow, so one trade means one emission
+                will_emit_price = trade_info.price > 0 and position.entry_price > 0
+                if backfilled and not will_emit_price and self.ui_callback:
+                    self.ui_callback('position_update', {
+                        'action': 'metadata_update',
+                        'mint': mint,
+                        'token_amount': position.token_amount
+                    })
+
                 # Update position with latest price from websocket
                 if trade_info.price > 0:
                     # Update current price for P&L calculations
@@ -1633,11 +1697,12 @@ class SniperBot:
                         position.pnl_sol = pnl_sol
                         position.pnl_percent = pnl_percent
                         
-                        logger.info(f"💰 Price update for {mint}: {trade_info.price:.12f} SOL")
-                        logger.info(f"   Entry: {position.entry_price:.12f} SOL, Current: {trade_info.price:.12f} SOL")
-                        logger.info(f"   P&L: {pnl_sol:.6f} SOL ({pnl_percent:+.2f}%)")
+                        logger.info("💰 Price update for %s: %.12f SOL", mint, trade_info.price)
+                        logger.info("   Entry: %.12f SOL, Current: %.12f SOL", position.entry_price, trade_info.price)
+                        logger.info("   P&L: %.6f SOL (%+.2f%%)", pnl_sol, pnl_percent)
                         
-                        # Update UI with price and P&L update
+                        # Update UI with price and P&L update (token_amount
+                        # included so a backfill rides the same frame)
                         if self.ui_callback:
                             self.ui_callback('position_update', {
                                 'action': 'price_update',
@@ -1645,12 +1710,13 @@ class SniperBot:
                                 'current_price': trade_info.price,
                                 'pnl_sol': pnl_sol,
                                 'pnl_percent': pnl_percent,
+                                'token_amount': position.token_amount,
                                 'timestamp': int(time.time())
                             })
-                            logger.info(f"📱 Sent price update to UI for {mint}")
-                
-                logger.info(f"📈 Token trade detected for our position: {mint}")
-                logger.info(f"📊 Current position - Symbol: {position.token_symbol}, Entry Price: ${position.entry_price:.6f}, Token Amount: {position.token_amount:,.0f}")
+                            logger.info("📱 Sent price update to UI for %s", mint)
+
+                logger.info("📈 Token trade detected for our position: %s", mint)
+                logger.info("📊 Current position - Symbol: %s, Entry Price: $%.6f, Token Amount: %.0f", position.token_symbol, position.entry_price, position.token_amount)
                 
                 # For buy transactions, track buy activity and check buy-count rule
                 if tx_type == 'buy':
@@ -1666,7 +1732,9 @@ class SniperBot:
                     logger.info(f"   Trade Token Amount: {trade_data.get('tokenAmount', 0.0)}")
                     
                     # Use HeliusAPI's buy count method for buy-count rule
-                    buy_count = self.helius_api.get_buy_count_for_token(mint, self.trade_history)
+                    buy_count = self.helius_api.get_buy_count_for_token(
+                        mint, self.trade_history, revision=self.trade_history_rev
+                    )
                     
                     logger.info(f"📈 PumpPortal: {buy_count} total buys detected for {mint}")
                     
@@ -1754,14 +1822,26 @@ class SniperBot:
                     # Log current buy count for debugging
                     if position.buy_count_since_entry > 0:
                         logger.debug(f"📊 {position.token_symbol or mint}: {position.buy_count_since_entry}/{config_manager.config.bot_settings.sell_after_buys} buyers")
-                
-                await asyncio.sleep(5)  # Check every 5 seconds
+
+                # Buy activity arrives via WebSocket callbacks; this loop is
+                # only a debug heartbeat, so sleep long when nothing is active
+                has_active = any(p.is_active for p in self.positions.values())
+                await asyncio.sleep(5 if has_active else 30)
                 
         except asyncio.CancelledError:
             logger.info("📊 Buy activity monitoring stopped")
         except Exception as e:
             logger.error(f"❌ Error monitoring buy activity: {e}")
 
+    def get_cached_balance(self) -> float | None:
+        """Last fetched SOL balance without touching RPC; None before any fetch"""
+        return self._balance_cache[1]
+
+    def is_balance_stale(self) -> bool:
+        """True when the cached balance has outlived BALANCE_CACHE_TTL"""
+        ts, cached = self._balance_cache
+        return cached is None or time.monotonic() - ts >= self.BALANCE_CACHE_TTL
+
     def get_wallet_balance_sync(self) -> float | None:
         """Get wallet balance synchronously (for startup/status checks)"""
         try:
@@ -1780,16 +1860,21 @@ class SniperBot:
                 else:
                     logger.info(f"💰 No wallet connected, returning None for balance (sync)")
                     return None
-            
+
+            ts, cached = self._balance_cache
+            if cached is not None and time.monotonic() - ts < self.BALANCE_CACHE_TTL:
+                return cached
+
             # Use a simple sync client for one-off balance checks
             from solana.rpc.api import Client
             sync_client = Client(HELIUS_RPC_URL)
-            
+
             balance_response = sync_client.get_balance(self.keypair.pubkey())
             if balance_response.value is not None:
                 balance_sol = balance_response.value / 10**9
                 # Update the config with the fresh balance
                 config_manager.update_bot_state(sol_balance=balance_sol)
+                self._balance_cache = (time.monotonic(), balance_sol)
                 logger.info(f"💰 Balance fetched: {balance_sol:.4f} SOL")
                 return balance_sol
             # If RPC didn't return a value, return cached balance
@@ -1818,6 +1903,10 @@ class SniperBot:
                 else:
                     logger.info(f"💰 No wallet connected, returning None for balance")
                     return None
+            ts, cached = self._balance_cache
+            if cached is not None and time.monotonic() - ts < self.BALANCE_CACHE_TTL:
+                return cached
+
             # Use async path only if there's a running loop; otherwise fall back to sync
             try:
                 asyncio.get_running_loop()
@@ -1828,6 +1917,7 @@ class SniperBot:
             if getattr(balance_response, 'value', None) is not None:
                 balance_sol = balance_response.value / 10**9
                 config_manager.update_bot_state(sol_balance=balance_sol)
+                self._balance_cache = (time.monotonic(), balance_sol)
                 return balance_sol
             return config_manager.config.bot_state.sol_balance
         except Exception as e:
@@ -2205,7 +2295,7 @@ class SniperBot:
                         'pnl': position.current_pnl,
                         'pnl_percent': position.current_pnl_percent,
                         'buy_count': position.buy_count_since_entry,
-                        'timestamp': int(datetime.now().timestamp())
+                        'timestamp': int(time.time())
                     })
 
                 # Stop listening to this token's trades after it becomes inactive
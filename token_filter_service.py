@@ -5,6 +5,7 @@ Token Filter Service - Handles token age filtering and Pump.fun API integration
 
 import asyncio
 import aiohttp
+import orjson
 import logging
 import time
 import ssl
@@ -56,6 +57,11 @@ class TokenFilterService:
         self.token_cache: Dict[str, TokenAgeInfo] = {}
         self.cache_expiry = 300  # 5 minutes cache
         self.last_cache_cleanup = time.time()
+        # Pump.fun token info cache: mint -> (fetched_at, data). Metadata is
+        # near-immutable, so repeat lookups in the trading loop become dict
+        # hits instead of network round trips (404s are cached too)
+        self.pump_info_cache: Dict[str, tuple] = {}
+        self.pump_info_cache_ttl = 300  # 5 minutes
         self.helius_client = AsyncClient(self.helius_rpc_url)
         
         # Initialize Pump.fun Helius endpoint availability (will be tested when needed)
@@ -106,9 +112,18 @@ class TokenFilterService:
             for key in expired_keys:
                 del self.token_cache[key]
             
+            # Sweep the pump.fun info cache on the same cadence; without
+            # this, every mint ever looked up stays resident forever
+            expired_pump_keys = [
+                mint for mint, (fetched_at, _) in self.pump_info_cache.items()
+                if current_time - fetched_at > self.pump_info_cache_ttl
+            ]
+            for key in expired_pump_keys:
+                del self.pump_info_cache[key]
+            
             self.last_cache_cleanup = current_time
-            if expired_keys:
-                logger.debug(f"🧹 Cleaned up {len(expired_keys)} expired cache entries")
+            if expired_keys or expired_pump_keys:
+                logger.debug(f"🧹 Cleaned up {len(expired_keys) + len(expired_pump_keys)} expired cache entries")
     
     def _get_age_threshold_days(self, filter_type: str, custom_days: int = 7) -> int:
         """Get the age threshold in days based on filter type"""
@@ -137,17 +152,24 @@ class TokenFilterService:
     
     async def get_pump_token_info(self, mint: str) -> Optional[Dict]:
         """Get token information from Pump.fun API with better error handling"""
+        self._cleanup_cache()
+        cached = self.pump_info_cache.get(mint)
+        if cached is not None and time.time() - cached[0] < self.pump_info_cache_ttl:
+            return cached[1]
+
         try:
             async with aiohttp.ClientSession() as session:
                 url = f"{self.pump_api_url}/token/{mint}"
                 async with session.get(url, timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         logger.debug(f"✅ Pump.fun API: Found token {mint}")
+                        self.pump_info_cache[mint] = (time.time(), data)
                         return data
                     elif response.status == 404:
                         # Token not found on Pump.fun - this is normal for many tokens
                         logger.debug(f"ℹ️ Pump.fun API: Token {mint} not found (404) - may not be on Pump.fun")
+                        self.pump_info_cache[mint] = (time.time(), None)
                         return None
                     else:
                         logger.warning(f"⚠️ Pump.fun API: Unexpected status {response.status} for {mint}")
@@ -155,7 +177,22 @@ class TokenFilterService:
         except Exception as e:
             logger.debug(f"❌ Pump.fun API error for {mint}: {e}")
             return None
-    
+
+    async def get_pump_token_infos(self, mints: List[str]) -> List[Optional[Dict]]:
+        """Fetch token info for several mints concurrently
+
+        Dispatches the lookups under a bounded semaphore so N mints cost
+        roughly one round trip instead of N sequential ones, while staying
+        under the API's rate limits. Results align with the input list.
+        """
+        sem = asyncio.Semaphore(16)
+
+        async def one(mint: str) -> Optional[Dict]:
+            async with sem:
+                return await self.get_pump_token_info(mint)
+
+        return await asyncio.gather(*(one(m) for m in mints))
+
     async def get_token_creation_time_from_helius(self, mint: str) -> Optional[int]:
         """Get token creation time from Helius RPC"""
         try:
@@ -446,7 +483,7 @@ class TokenFilterService:
                     async with aiohttp.ClientSession() as session:
                         async with session.get(url, timeout=15) as response:
                             if response.status == 200:
-                                data = await response.json()
+                                data = orjson.loads(await response.read())
                                 
                                 if not data:  # No more data
                                     logger.info(f"📊 No more tokens found at offset {offset}")
@@ -756,7 +793,7 @@ class TokenFilterService:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, timeout=15) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         logger.info(f"✅ Pump.fun Runners API: Successfully fetched {len(data)} trending tokens")
                         
                         # Convert Pump.fun runners data format to our standard format with batch processing
@@ -1045,7 +1082,7 @@ class TokenFilterService:
                         timeout=10
                     ) as response:
                         if response.status == 200:
-                            response_data = await response.json()
+                            response_data = orjson.loads(await response.read())
                             if "result" in response_data:
                                 tokens = response_data["result"]
                                 logger.info(f"📊 Pump.fun Helius: Found {len(tokens)} tokens")
@@ -1070,7 +1107,7 @@ class TokenFilterService:
                         timeout=10
                     ) as response:
                         if response.status == 200:
-                            response_data = await response.json()
+                            response_data = orjson.loads(await response.read())
                             if "result" in response_data:
                                 tokens = response_data["result"]
                                 logger.info(f"📊 Pump.fun Helius: Found {len(tokens)} recent tokens")
@@ -1110,7 +1147,7 @@ class TokenFilterService:
             async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
                 async with session.get('https://frontend-api-v3.pump.fun/sol-price') as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         self.sol_price_usd = data.get('solPrice', 100.0)
                         self.last_sol_price_update = current_time
                         logger.info(f"📈 Updated SOL price: ${self.sol_price_usd:.2f}")
@@ -1140,7 +1177,7 @@ class TokenFilterService:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, headers=headers, timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         logger.info(f"✅ Fetched holder data for {mint_address} from SolanaTracker")
                         return data
                     else:
@@ -1172,7 +1209,7 @@ class TokenFilterService:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, headers=headers, timeout=15) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         logger.info(f"✅ Fetched holder data for {mint_address} from Moralis (fallback)")
                         
                         # Check if data is None or empty
@@ -1243,7 +1280,7 @@ class TokenFilterService:
     #                 logger.info(f"📡 Response status: {response.status}")
                     
     #                 if response.status == 200:
-    #                     data = await response.json()
+    #                     data = orjson.loads(await response.read())
     #                     logger.info(f"📋 SolanaTracker response for {mint}: {data}")
                         
     #                     # Try to get total count from response
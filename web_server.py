@@ -1,10 +1,23 @@
 from flask import Flask, render_template, request, jsonify
 from flask_socketio import SocketIO, emit
 import asyncio
+import sys
 import threading
 import logging
+import orjson
+from collections import deque
 from typing import Dict, Any
 
+# Swap the bot loop's asyncio backend for libuv where available; the bot
+# is socket-heavy (PumpPortal WebSocket + Helius RPC) and uvloop roughly
+# doubles throughput on that kind of workload
+if sys.platform != 'win32':
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
 from config import config_manager
 from sniper_bot import SniperBot
 
@@ -15,65 +28,158 @@ logger = logging.getLogger(__name__)
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'pump-fun-sniper-secret-key'
+# Skip per-response key sorting and pretty-printing whitespace
+app.json.sort_keys = False
+app.json.compact = True
+
+
+class _OrjsonWire:
+    """json= shim so Socket.IO packets serialize through orjson's C encoder
+
+    python-socketio passes json-module kwargs like separators; orjson's
+    output is already compact so they are accepted and ignored.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+# Construction-time flags: orjson on the wire, per-packet logging off
+_SIO_OPTS = dict(cors_allowed_origins="*", json=_OrjsonWire,
+                 logger=False, engineio_logger=False)
 
 # Initialize SocketIO with fallback for Python 3.13 compatibility
 try:
-    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+    socketio = SocketIO(app, async_mode='threading', **_SIO_OPTS)
 except Exception as e:
     logger.warning(f"Failed to initialize SocketIO with threading mode: {e}")
     try:
-        socketio = SocketIO(app, cors_allowed_origins="*", async_mode='gevent')
+        socketio = SocketIO(app, async_mode='gevent', **_SIO_OPTS)
     except Exception as e2:
         logger.warning(f"Failed to initialize SocketIO with gevent mode: {e2}")
         # Fallback to basic mode
-        socketio = SocketIO(app, cors_allowed_origins="*")
+        socketio = SocketIO(app, **_SIO_OPTS)
 
 # Global bot instance
 bot = SniperBot()
 bot_thread = None
 loop = None
 
+
+def _ensure_bot_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared bot event loop, starting its thread on first use
+
+    One persistent loop serves every start/stop cycle and manual trade, so
+    nothing pays for loop construction per request and coroutines always
+    run where the bot's connections and locks live.
+    """
+    global loop, bot_thread
+    if loop is not None and not loop.is_closed():
+        return loop
+
+    loop = asyncio.new_event_loop()
+
+    def _run():
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    bot_thread = threading.Thread(target=_run, daemon=True)
+    bot_thread.start()
+    return loop
+
+
+def _submit_to_bot_loop(coro, timeout: float = 30):
+    """Run a coroutine on the bot loop and wait for its result"""
+    future = asyncio.run_coroutine_threadsafe(coro, _ensure_bot_loop())
+    return future.result(timeout=timeout)
+
 # Set up the trade callback for the bot's monitor
 bot.monitor.set_trade_callback(bot._handle_pumpportal_trade)
 logger.info("✅ Trade callback connected to bot monitor")
 logger.info(f"📊 Trade callback function: {bot._handle_pumpportal_trade.__name__}")
 logger.info(f"📊 Trade callback is async: {asyncio.iscoroutinefunction(bot._handle_pumpportal_trade)}")
 
+# New-token bursts are buffered here and flushed by one background task so
+# a listing storm costs a single wakeup per flush interval instead of one
+# emit per token; the bound drops the oldest tokens under sustained floods
+_pending_tokens: deque = deque(maxlen=500)
+_token_flusher_started = False
+_token_flusher_lock = threading.Lock()
+
+# Connected Socket.IO clients; firehose payloads are not built or queued
+# when nobody is watching
+_connected_clients = 0
+_client_count_lock = threading.Lock()
+
+
+def _flush_pending_tokens():
+    """Drain the new-token buffer to connected clients every 100 ms"""
+    while True:
+        socketio.sleep(0.1)
+        while _pending_tokens:
+            socketio.emit('new_token', _pending_tokens.popleft())
+
+
+def _ensure_token_flusher():
+    global _token_flusher_started
+    with _token_flusher_lock:
+        if not _token_flusher_started:
+            socketio.start_background_task(_flush_pending_tokens)
+            _token_flusher_started = True
+
+# Fields forwarded to the frontend for each new token; hoisted so the
+# per-token payload is one comprehension over a shared tuple
+_TOKEN_FIELDS = (
+    'mint', 'symbol', 'name', 'market_cap', 'price', 'sol_in_pool',
+    'tokens_in_pool', 'initial_buy', 'created_timestamp', 'liquidity',
+    'holders', 'age_days', 'is_on_pump', 'pump_info',
+)
+
 class WebSocketHandler:
     """Handle WebSocket communications"""
-    
+
     @staticmethod
     def emit_new_token(token_data: Dict[str, Any]):
-        """Emit new token event to frontend"""
+        """Queue new token event for the batched flush to the frontend"""
+        if _connected_clients == 0:
+            return
         logger.info(f"📡 WebSocket: Emitting token to frontend: {token_data.get('symbol', 'Unknown')}")
         logger.info(f"📋 WebSocket: Token data: {token_data}")
-        
-        socketio.emit('new_token', {
-            'mint': token_data.get('mint'),
-            'symbol': token_data.get('symbol'),
-            'name': token_data.get('name'),
-            'market_cap': token_data.get('market_cap'),
-            'price': token_data.get('price'),
-            'sol_in_pool': token_data.get('sol_in_pool'),
-            'tokens_in_pool': token_data.get('tokens_in_pool'),
-            'initial_buy': token_data.get('initial_buy'),
-            'created_timestamp': token_data.get('created_timestamp'),
-            'liquidity': token_data.get('liquidity'),
-            'holders': token_data.get('holders'),
-            'age_days': token_data.get('age_days'),
-            'is_on_pump': token_data.get('is_on_pump'),
-            'pump_info': token_data.get('pump_info'),
-            'source': token_data.get('source', 'pumpportal')
-        })
-        
-        logger.info(f"✅ WebSocket: Token emitted successfully")
+
+        _ensure_token_flusher()
+        payload = {field: token_data.get(field) for field in _TOKEN_FIELDS}
+        payload['source'] = token_data.get('source', 'pumpportal')
+        _pending_tokens.append(payload)
+
+        logger.info(f"✅ WebSocket: Token queued for emission")
     
+    # Last payload emitted per mint, with the timestamp stripped: if nothing
+    # but the clock moved since the previous update there is no point pushing
+    # an identical frame at the browser
+    _last_position_payloads: Dict[str, tuple] = {}
+
     @staticmethod
     def emit_position_update(position_data: Dict[str, Any]):
-        """Emit position update to frontend"""
+        """Emit position update to frontend (skipping no-op repeats)"""
+        mint = position_data.get('mint')
+        try:
+            snap = tuple(sorted(
+                (k, v) for k, v in position_data.items() if k != 'timestamp'
+            ))
+        except TypeError:
+            snap = None
+        if snap is not None and WebSocketHandler._last_position_payloads.get(mint) == snap:
+            return
         logger.info(f"📡 WebSocket: Emitting position update to frontend")
         logger.info(f"📋 WebSocket: Position data: {position_data}")
         socketio.emit('position_update', position_data)
+        if snap is not None:
+            WebSocketHandler._last_position_payloads[mint] = snap
         logger.info(f"✅ WebSocket: Position update emitted successfully")
     
     @staticmethod
@@ -116,43 +222,43 @@ class WebSocketHandler:
         """Emit loading status event to frontend (quick mode)"""
         socketio.emit('loading_status', data)
 
+# Event-type -> emitter lookup built once, replacing the per-event
+# if/elif walk down the handler list
+_EMITTERS = {
+    'new_token': WebSocketHandler.emit_new_token,
+    'position_update': WebSocketHandler.emit_position_update,
+    'transaction': WebSocketHandler.emit_transaction,
+    'transaction_update': WebSocketHandler.emit_transaction_update,
+    'price_update': WebSocketHandler.emit_price_update,
+    'trade_update': WebSocketHandler.emit_trade_update,
+    'loading_status': WebSocketHandler.emit_loading_status,
+    'error': WebSocketHandler.emit_error,
+    'auto_buy_success': WebSocketHandler.emit_auto_buy_success,
+    'auto_buy_error': WebSocketHandler.emit_auto_buy_error,
+}
+
+
 async def handle_bot_event(event_type: str, data: Dict[str, Any]):
     """Handle bot events for WebSocket emission"""
-    if event_type == 'new_token':
-        WebSocketHandler.emit_new_token(data)
-    elif event_type == 'position_update':
-        WebSocketHandler.emit_position_update(data)
-    elif event_type == 'transaction':
-        WebSocketHandler.emit_transaction(data)
-    elif event_type == 'transaction_update':
-        WebSocketHandler.emit_transaction_update(data)
-    elif event_type == 'price_update':
-        WebSocketHandler.emit_price_update(data)
-    elif event_type == 'trade_update':
-        WebSocketHandler.emit_trade_update(data)
-    elif event_type == 'loading_status':
-        WebSocketHandler.emit_loading_status(data)
-    elif event_type == 'error':
-        WebSocketHandler.emit_error(data)
-    elif event_type == 'auto_buy_success':
-        WebSocketHandler.emit_auto_buy_success(data)
-    elif event_type == 'auto_buy_error':
-        WebSocketHandler.emit_auto_buy_error(data)
+    emitter = _EMITTERS.get(event_type)
+    if emitter is not None:
+        emitter(data)
     else:
         logger.warning(f"⚠️ Unknown event type: {event_type}")
 
 def handle_bot_event_sync(event_type: str, data: Dict[str, Any]):
-    """Synchronous wrapper for bot event handling"""
-    import asyncio
+    """Synchronous bot event handling
+
+    The emitters are plain socketio.emit calls and thread-safe, so they
+    are dispatched directly — no task creation or throwaway event loop
+    per event on the async->UI hot path.
+    """
     try:
-        # Get the current event loop or create a new one
-        try:
-            loop = asyncio.get_running_loop()
-            # If we're in an async context, create a task
-            asyncio.create_task(handle_bot_event(event_type, data))
-        except RuntimeError:
-            # No running loop, run in new event loop
-            asyncio.run(handle_bot_event(event_type, data))
+        emitter = _EMITTERS.get(event_type)
+        if emitter is not None:
+            emitter(data)
+        else:
+            logger.warning(f"⚠️ Unknown event type: {event_type}")
     except Exception as e:
         logger.error(f"❌ Error handling bot event {event_type}: {e}")
 
@@ -240,42 +346,44 @@ def disconnect_wallet():
             'error': str(e)
         }), 500
 
+# Accepted settings keys and their coercions; built once instead of on
+# every /api/settings/update request
+_VALID_SETTINGS = {
+    'sol_per_snipe': float,
+    'max_positions': int,
+    'profit_target_percent': float,
+    'stop_loss_percent': float,
+    'min_market_cap': float,
+    'max_market_cap': float,
+    'min_liquidity': float,
+    'min_holders': int,
+    'auto_buy': bool,
+    'auto_sell': bool,
+    'sell_strategy': str,
+    'sell_after_buys': int,
+    'sell_after_seconds': int,
+    'token_age_filter': str,
+    'custom_days': int,
+    'include_pump_tokens': bool,
+    'transaction_type': str,
+    'priority_fee': float,
+    'historical_batch_size': int,
+    'quick_mode': bool,
+    'quick_mode_batch_size': int,
+    'max_tokens_in_table': int
+}
+
+
 @app.route('/api/settings/update', methods=['POST'])
 def update_settings():
     """Update bot settings"""
     try:
         data = request.get_json()
-        
-        # Validate settings
-        valid_settings = {
-            'sol_per_snipe': float,
-            'max_positions': int,
-            'profit_target_percent': float,
-            'stop_loss_percent': float,
-            'min_market_cap': float,
-            'max_market_cap': float,
-            'min_liquidity': float,
-            'min_holders': int,
-            'auto_buy': bool,
-            'auto_sell': bool,
-            'sell_strategy': str,
-            'sell_after_buys': int,
-            'sell_after_seconds': int,
-            'token_age_filter': str,
-            'custom_days': int,
-            'include_pump_tokens': bool,
-            'transaction_type': str,
-            'priority_fee': float,
-            'historical_batch_size': int,
-            'quick_mode': bool,
-            'quick_mode_batch_size': int,
-            'max_tokens_in_table': int
-        }
-        
+
         settings = {}
         for key, value in data.items():
-            if key in valid_settings:
-                settings[key] = valid_settings[key](value)
+            if key in _VALID_SETTINGS:
+                settings[key] = _VALID_SETTINGS[key](value)
 
         # Back-compat: convert legacy hours to seconds if provided
         if 'sell_after_hours' in data and 'sell_after_seconds' not in settings:
@@ -307,41 +415,27 @@ def update_settings():
 @app.route('/api/bot/start', methods=['POST'])
 def start_monitoring():
     """Start bot monitoring"""
-    global bot_thread, loop
-    
     try:
         if config_manager.config.bot_state.is_running:
             return jsonify({
                 'success': False,
                 'error': 'Bot is already running'
             }), 400
-        
+
         # Verify trade callback is set up
         logger.info("🔍 Verifying trade callback setup...")
         logger.info(f"📊 Monitor trade callback: {bot.monitor.trade_callback}")
         logger.info(f"📊 Monitor trade callback name: {bot.monitor.trade_callback.__name__ if bot.monitor.trade_callback else 'None'}")
-        
-        def run_bot():
-            global loop
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(bot.start_monitoring())
-            except Exception as e:
-                logger.error(f"Error in bot thread: {e}")
-            finally:
-                if loop and not loop.is_closed():
-                    loop.close()
-        
-        bot_thread = threading.Thread(target=run_bot)
-        bot_thread.daemon = True
-        bot_thread.start()
-        
+
+        # Fire-and-forget onto the persistent bot loop; the loop (and its
+        # WebSocket connection) survives stop/start cycles
+        asyncio.run_coroutine_threadsafe(bot.start_monitoring(), _ensure_bot_loop())
+
         return jsonify({
             'success': True,
             'message': 'Bot monitoring started'
         })
-        
+
     except Exception as e:
         logger.error(f"Error starting bot: {e}")
         return jsonify({
@@ -352,14 +446,11 @@ def start_monitoring():
 @app.route('/api/bot/stop', methods=['POST'])
 def stop_monitoring():
     """Stop bot monitoring"""
-    global bot_thread, loop
-    
     try:
         success = bot.stop_monitoring()
-        
-        if bot_thread and bot_thread.is_alive():
-            bot_thread.join(timeout=5)
-        
+
+        # The bot loop thread stays alive for the next start and for
+        # manual trades; only monitoring state is torn down
         return jsonify({
             'success': success,
             'message': 'Bot monitoring stopped' if success else 'Failed to stop bot'
@@ -392,16 +483,8 @@ def manual_buy():
                 'error': 'Mint address is required'
             }), 400
         
-        # Execute buy in async context
-        async def execute_buy():
-            return await bot.buy_token(mint, amount, symbol, name)
-        
-        # Run in the bot's event loop if it exists
-        if loop and not loop.is_closed():
-            future = asyncio.run_coroutine_threadsafe(execute_buy(), loop)
-            success = future.result(timeout=30)
-        else:
-            success = asyncio.run(execute_buy())
+        # Execute on the shared bot loop
+        success = _submit_to_bot_loop(bot.buy_token(mint, amount, symbol, name))
         
         return jsonify({
             'success': success,
@@ -428,16 +511,8 @@ def manual_sell():
                 'error': 'Mint address is required'
             }), 400
         
-        # Execute sell in async context
-        async def execute_sell():
-            return await bot.sell_token(mint)
-        
-        # Run in the bot's event loop if it exists
-        if loop and not loop.is_closed():
-            future = asyncio.run_coroutine_threadsafe(execute_sell(), loop)
-            success = future.result(timeout=30)
-        else:
-            success = asyncio.run(execute_sell())
+        # Execute on the shared bot loop
+        success = _submit_to_bot_loop(bot.sell_token(mint))
         
         return jsonify({
             'success': success,
@@ -463,12 +538,23 @@ def get_positions():
 
 @app.route('/api/wallet/sol_balance', methods=['GET'])
 def get_sol_balance():
-    """Fetch current SOL balance directly from RPC"""
+    """Serve the last known SOL balance, refreshing via RPC in the background
+
+    The request thread never waits on the RPC once a balance has been
+    fetched: stale values are served immediately and a refresh is fired
+    on the bot loop so the next poll sees the new number.
+    """
     try:
-        # Prefer sync method to avoid event loop issues when server thread changes
-        balance = bot.get_wallet_balance_sync()
+        balance = bot.get_cached_balance()
         if balance is None:
-            return jsonify({'success': False, 'sol_balance': None, 'error': 'no_wallet'})
+            # First request (or no wallet yet): one blocking fetch
+            balance = bot.get_wallet_balance_sync()
+            if balance is None:
+                return jsonify({'success': False, 'sol_balance': None, 'error': 'no_wallet'})
+            return jsonify({'success': True, 'sol_balance': balance})
+
+        if bot.is_balance_stale():
+            asyncio.run_coroutine_threadsafe(bot.get_wallet_balance(), _ensure_bot_loop())
         return jsonify({'success': True, 'sol_balance': balance})
     except Exception as e:
         logger.error(f"Error fetching SOL balance: {e}")
@@ -480,16 +566,8 @@ def get_transactions():
     try:
         limit = request.args.get('limit', 50, type=int)
         
-        # Execute in async context
-        async def fetch_transactions():
-            return await bot.fetch_wallet_transactions(limit)
-        
-        # Run in the bot's event loop if it exists
-        if loop and not loop.is_closed():
-            future = asyncio.run_coroutine_threadsafe(fetch_transactions(), loop)
-            transactions = future.result(timeout=30)
-        else:
-            transactions = asyncio.run(fetch_transactions())
+        # Execute on the shared bot loop
+        transactions = _submit_to_bot_loop(bot.fetch_wallet_transactions(limit))
         
         return jsonify({
             'success': True,
@@ -517,8 +595,11 @@ def delete_position(mint):
 @socketio.on('connect')
 def handle_connect(auth=None):
     """Handle client connection"""
+    global _connected_clients
+    with _client_count_lock:
+        _connected_clients += 1
     logger.info("Client connected")
-    
+
     # Send current bot status
     status = bot.get_bot_status()
     emit('status_update', status)
@@ -526,6 +607,9 @@ def handle_connect(auth=None):
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
+    global _connected_clients
+    with _client_count_lock:
+        _connected_clients = max(0, _connected_clients - 1)
     logger.info("Client disconnected")
 
 if __name__ == '__main__':